@@ -0,0 +1,192 @@
+"""Search the honeybee-energy standards libraries from the Grasshopper components.
+
+The "HB Search" components import these functions so that the word index and
+the property tables of each library are built once per Rhino session and are
+then shared between all of the components on the canvas.
+"""
+import re
+import bisect
+
+# pattern to split library identifiers into words
+WORD_SPLIT = re.compile(r'[^A-Z0-9]+')
+# pattern to split range text into operators, properties and numbers
+RANGE_TOKENS = re.compile(r'[<>]=?|=+|[^\s<>=]+')
+FLIP_OPERATOR = {'<': '>', '<=': '>=', '>': '<', '>=': '<='}
+
+# caches of the libraries, which hold each library so its id cannot be re-used
+_library_indices = {}
+_property_tables = {}
+
+
+def library_index(library):
+    """Get an inverted index of the words in the identifiers of a library.
+
+    The index is only rebuilt if the number of objects in the library changes.
+
+    Args:
+        library: A dictionary or list of library identifiers.
+
+    Returns:
+        A dictionary with the following keys.
+
+        -   words: A dictionary mapping each upper-case word of the identifiers
+            to a set of indices in the sorted identifiers.
+
+        -   sorted: A sorted list of the library identifiers.
+    """
+    index = _library_indices.get(id(library))
+    if index is None or index['count'] != len(library):
+        sorted_items = sorted(library)
+        words = {}  # maps each word to the indices of the sorted identifiers
+        for i, item in enumerate(sorted_items):
+            for word in WORD_SPLIT.split(item.upper()):
+                if word:
+                    try:
+                        words[word].add(i)
+                    except KeyError:
+                        words[word] = set((i,))
+        index = {'library': library, 'count': len(library), 'words': words,
+                 'sorted': sorted_items}
+        _library_indices[id(library)] = index
+    return index
+
+
+def search_library(library, keywords, parse_phrases=True):
+    """Get a sorted list of library identifiers containing all of the keywords.
+
+    This gives the same result as sorted(filter_array_by_keywords(...)) but the
+    keywords are only compared to the unique words of the library identifiers.
+
+    Args:
+        library: A dictionary or list of library identifiers.
+        keywords: A list of keywords to search for. If empty, all identifiers
+            of the library are returned.
+        parse_phrases: If True, keywords with several words separated by
+            spaces are split into separate keywords. (Default: True).
+    """
+    index = library_index(library)
+    if parse_phrases:
+        keywords = [kw for words in keywords for kw in words.upper().split()]
+    else:
+        keywords = [kw.upper() for kw in keywords]
+    matches = None
+    for kw in keywords:
+        if not kw:  # an empty keyword matches everything
+            continue
+        if WORD_SPLIT.search(kw) is None:  # keyword is within a single word
+            kw_matches = set()
+            for word, item_is in index['words'].items():
+                if kw in word:
+                    kw_matches.update(item_is)
+        else:  # keyword spans several words; check the identifiers directly
+            items = index['sorted']
+            pool = range(len(items)) if matches is None else matches
+            kw_matches = set(i for i in pool if kw in items[i].upper())
+        matches = kw_matches if matches is None else matches & kw_matches
+        if len(matches) == 0:
+            break
+    if matches is None:
+        return list(index['sorted'])
+    return [index['sorted'][i] for i in sorted(matches)]
+
+
+def parse_range(range_text, properties):
+    """Parse text like "0.2 < u_factor < 0.5" or "r_value >= 2" into a property range.
+
+    Args:
+        range_text: Text for the range of a property.
+        properties: A list of the property names that can be used in the range.
+
+    Returns:
+        A tuple with the property name followed by (value, inclusive) tuples for
+        the lower and upper bounds of the range. Unbounded sides are None.
+    """
+    tokens = RANGE_TOKENS.findall(range_text)
+    try:
+        if len(tokens) == 3 and tokens[0] in properties:
+            attr, conditions = tokens[0], [(tokens[1], tokens[2])]
+        elif len(tokens) == 3 and tokens[2] in properties:
+            attr, conditions = tokens[2], [(FLIP_OPERATOR[tokens[1]], tokens[0])]
+        elif len(tokens) == 5 and tokens[2] in properties:
+            if tokens[1][0] != tokens[3][0]:  # both bounds are on the same side
+                raise ValueError
+            attr = tokens[2]
+            conditions = [(FLIP_OPERATOR[tokens[1]], tokens[0]), (tokens[3], tokens[4])]
+        else:
+            raise ValueError
+        low, high = None, None
+        for operator, number in conditions:
+            if operator not in FLIP_OPERATOR:  # a stray = or a missing operator
+                raise ValueError
+            if operator.startswith('>'):
+                low = (float(number), operator == '>=')
+            else:
+                high = (float(number), operator == '<=')
+    except (ValueError, KeyError):
+        raise ValueError(
+            'Input ranges_ "{}" is not valid. It should look like "r_value > 2" or '
+            '"0.2 < u_factor < 0.5" using one of the following properties:\n'
+            '{}'.format(range_text, '\n'.join(properties)))
+    return attr, low, high
+
+
+def property_table(library, by_identifier, attr, properties):
+    """Get the values of a property for all objects of a library sorted by value.
+
+    The objects of the library are loaded once to build the values of all
+    properties together and the tables are only rebuilt if the number of objects
+    in the library changes.
+
+    Args:
+        library: A dictionary or list of library identifiers.
+        by_identifier: A function to get a library object from its identifier.
+        attr: Text for the property of which the values will be returned.
+        properties: A list of all property names to be put in the tables.
+
+    Returns:
+        A tuple with a sorted list of property values and a list of the library
+        identifiers that align with the values.
+    """
+    key = (id(library), tuple(properties))
+    table = _property_tables.get(key)
+    if table is None or table['count'] != len(library):
+        prop_values = dict((prop, []) for prop in properties)
+        for obj_id in library:
+            obj = by_identifier(obj_id)
+            for prop, values in prop_values.items():
+                try:
+                    values.append((float(getattr(obj, prop)), obj_id))
+                except Exception:  # the property is not available for the object
+                    pass
+        props = {}
+        for prop, values in prop_values.items():
+            values.sort()
+            props[prop] = ([v[0] for v in values], [v[1] for v in values])
+        table = {'library': library, 'count': len(library), 'properties': props}
+        _property_tables[key] = table
+    return table['properties'][attr]
+
+
+def filter_by_ranges(identifiers, library, by_identifier, ranges, properties):
+    """Filter a list of library identifiers to only those within property ranges.
+
+    Args:
+        identifiers: A list of library identifiers to be filtered.
+        library: The dictionary or list of library identifiers that contains
+            the identifiers.
+        by_identifier: A function to get a library object from its identifier.
+        ranges: A list of ranges from the parse_range function.
+        properties: A list of all property names that can be used in the ranges.
+    """
+    for attr, low, high in ranges:
+        values, ids = property_table(library, by_identifier, attr, properties)
+        st_i, end_i = 0, len(values)
+        if low is not None:
+            st_i = bisect.bisect_left(values, low[0]) if low[1] \
+                else bisect.bisect_right(values, low[0])
+        if high is not None:
+            end_i = bisect.bisect_right(values, high[0]) if high[1] \
+                else bisect.bisect_left(values, high[0])
+        in_range = set(ids[st_i:end_i])
+        identifiers = [obj_id for obj_id in identifiers if obj_id in in_range]
+    return identifiers
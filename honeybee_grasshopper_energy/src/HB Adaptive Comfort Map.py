@@ -55,6 +55,17 @@ greater will be considered occupied. All hours of the outdoors are considered oc
             component to specify the criteria under which conditions are
             considered acceptable/comfortable. The default will use ASHRAE-55
             adaptive comfort criteria.
+        sweep_: An optional list of text for combinations of comfort inputs to be
+            evaluated in a comfort parameter sweep. Each item is one combination
+            and it has one or more "input: value" pairs separated by "|"
+            (eg. "air-speed: 0.5 | comfort-parameters: AdaptiveParameter,..."). The
+            input can be air-speed or comfort-parameters and any input that is not
+            in a combination uses the value connected to this component. Values
+            can be numbers, paths to CSV files or comfort parameter text. All
+            combinations use the same EnergyPlus and Radiance results but the
+            recipe is re-run once for each combination, including its folder
+            preparation and comfort post-processing. So the run time grows
+            with the number of combinations.
         solar_body_par_: Optional solar body parameters from the "LB Solar Body Parameters"
             object to specify the properties of the human geometry assumed in the
             shortwave MRT calculation. The default assumes average skin/clothing
@@ -65,8 +76,13 @@ greater will be considered occupied. All hours of the outdoors are considered oc
         run_settings_: Settings from the "HB Recipe Settings" component that specify
             how the recipe should be run. This can also be a text string of
             recipe settings.
-        _run: Set to True to run the recipe and get results. This input can also be
-            the integer "2" to run the recipe silently.
+        _run: Set to True to run the recipe and get results. This input can also
+            be the integer "2" to run the recipe silently. If the model, weather
+            files, north, run period and solar body/radiance parameters are
+            unchanged since the last run of this component, the existing
+            Radiance and EnergyPlus results will be reused and only the comfort
+            post-processing will be re-run. So changing the air speed or comfort
+            parameters does not require the whole recipe to be re-run.
 
     Returns:
         report: Reports, errors, warnings, etc.
@@ -121,6 +137,10 @@ greater will be considered occupied. All hours of the outdoors are considered oc
             where the occupancy schedule is >= 0.1 will be considered occupied).
             Outdoor sensors are considered occupied at all times. More custom CSP
             studies can be done by post-processing the condition results.
+        sweep_par: A list of text describing each combination of comfort inputs
+            that was evaluated. When sweep_ is connected, the TCP, HSP and CSP
+            outputs will have one branch for each combination in this list and
+            all of the other outputs are for the first combination.
 """
 
 ghenv.Component.Name = 'HB Adaptive Comfort Map'
@@ -130,18 +150,102 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '7 :: Thermal Map'
 ghenv.Component.AdditionalHelpFromDocStrings = '1'
 
+import os
+import hashlib
+import copy
+
+import scriptcontext as sc
+
 try:
     from lbt_recipes.recipe import Recipe
+    from lbt_recipes.settings import RecipeSettings
     from honeybee.model import Model
 except ImportError as e:
     raise ImportError('\nFailed to import lbt_recipes:\n\t{}'.format(e))
 
+try:
+    from ladybug.futil import nukedir
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.config import units_system
-    from ladybug_rhino.grasshopper import all_required_inputs, recipe_result
+    from ladybug_rhino.grasshopper import all_required_inputs, recipe_result, \
+        list_to_data_tree
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+# sub-folders of the simulation folder with results of the comfort post-processing
+COMFORT_FOLDERS = ('initial_results', 'results', 'metrics')
+# file that marks the comfort post-processing of the simulation folder as done
+COMFORT_DONE = 'run_comfort_map.done'
+
+
+def stage_hash(model, *args):
+    """Get a hash for the inputs that determine the EnergyPlus and Radiance results.
+
+    Args:
+        model: The Honeybee Model (or HBJSON file path) input to the recipe.
+            Models are hashed with their identifier and their Python id
+            since any change to an upstream Model produces a new object.
+        args: Any other recipe inputs that influence the results before the
+            comfort post-processing. File paths will be hashed with the time
+            at which the file was last modified.
+    """
+    hasher = hashlib.md5()
+    if isinstance(model, Model):
+        model = '{}|{}'.format(model.identifier, id(model))
+    for arg in (model,) + args:
+        if isinstance(arg, str) and os.path.isfile(arg):
+            arg = '{}|{}'.format(arg, os.path.getmtime(arg))
+        hasher.update(str(arg).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def clear_comfort_results(project_folder, recipe):
+    """Delete the comfort post-processing results of a recipe in a project folder.
+
+    This ensures that only the comfort post-processing is re-run when the recipe
+    is executed again with reload_old set to True. The few steps of the folder
+    preparation that write into the deleted folders are also re-run but all of
+    the EnergyPlus and Radiance simulations are reused.
+    """
+    sim_folder = os.path.join(project_folder, recipe.simulation_id)
+    for sub_f in COMFORT_FOLDERS:
+        sub_dir = os.path.join(sim_folder, sub_f)
+        if os.path.isdir(sub_dir):
+            nukedir(sub_dir, True)
+    done_file = os.path.join(sim_folder, COMFORT_DONE)
+    if os.path.isfile(done_file):
+        os.remove(done_file)
+
+
+def parse_sweep(sweep, comf_inputs, base_values):
+    """Get a list of comfort input values for each combination of a sweep.
+
+    Args:
+        sweep: A list of text for each combination with "input: value" pairs
+            separated by "|".
+        comf_inputs: A tuple with the names of the comfort inputs of the recipe.
+        base_values: A list of values for each of the comfort_inputs that will be
+            used if the input is not in a combination.
+    """
+    comf_combs = []
+    for comb_str in sweep:
+        comb = list(base_values)
+        for pair in comb_str.split('|'):
+            try:
+                inp_name, inp_val = [v.strip() for v in pair.split(':', 1)]
+                comb[comf_inputs.index(inp_name)] = inp_val
+            except ValueError:
+                raise ValueError(
+                    'Sweep combination "{}" is not valid. Each combination must '
+                    'have "input: value" pairs separated by "|" and the input must '
+                    'be one of the following:\n{}'.format(
+                        comb_str, '\n'.join(comf_inputs)))
+        comf_combs.append(comb)
+    return comf_combs
+
 
 if all_required_inputs(ghenv.Component) and _run:
     # create the recipe and set the input arguments
@@ -152,8 +256,6 @@ if all_required_inputs(ghenv.Component) and _run:
     recipe.input_value_by_name('north', north_)
     recipe.input_value_by_name('run-period', run_period_)
     recipe.input_value_by_name('additional-idf', add_str_)
-    recipe.input_value_by_name('air-speed', _air_speed_)
-    recipe.input_value_by_name('comfort-parameters', comfort_par_)
     recipe.input_value_by_name('solarcal-parameters', solar_body_par_)
     recipe.input_value_by_name('radiance-parameters', radiance_par_)
 
@@ -173,10 +275,47 @@ if all_required_inputs(ghenv.Component) and _run:
                     'Is this correct?\n{}'.format(_model.units, e)
                 raise ValueError(error)
 
-    # run the recipe
+    # check whether the results of a previous run can be reused
+    if isinstance(run_settings_, RecipeSettings):
+        settings = copy.copy(run_settings_)
+    else:
+        settings = RecipeSettings() if run_settings_ is None \
+            else RecipeSettings.from_string(run_settings_)
+    sim_hash = stage_hash(
+        _model, _epw, _ddy, north_, run_period_, add_str_,
+        solar_body_par_, radiance_par_, settings.folder)
+    cache_key = 'comfort_map_{}'.format(ghenv.Component.InstanceGuid)
+    last_run = sc.sticky.get(cache_key)
+    if last_run is not None and last_run[0] == sim_hash and \
+            os.path.isdir(last_run[1]):
+        clear_comfort_results(last_run[1], recipe)
+        settings.reload_old = True
+        print('Reusing Radiance and EnergyPlus results from:\n{}'.format(last_run[1]))
+
+    # run the recipe for each combination of comfort inputs
+    # the first combination is run last so that its results remain in the folders
     silent = True if _run > 1 else False
-    project_folder = recipe.run(
-        run_settings_, radiance_check=True, openstudio_check=True, silent=silent)
+    comf_inputs = ('air-speed', 'comfort-parameters')
+    base_values = (_air_speed_, comfort_par_)
+    comf_combs = parse_sweep(sweep_, comf_inputs, base_values) \
+        if len(sweep_) != 0 else [base_values]
+    sweep_results = []
+    for i, comb in enumerate(reversed(comf_combs)):
+        for inp_name, inp_val in zip(comf_inputs, comb):
+            recipe.input_value_by_name(inp_name, inp_val)
+        if i != 0:  # reuse the simulations and re-run the comfort steps
+            clear_comfort_results(project_folder, recipe)
+            settings.reload_old = True
+        project_folder = recipe.run(
+            settings, radiance_check=True, openstudio_check=True, silent=silent)
+        if len(sweep_) != 0:  # read the metrics before the next run replaces them
+            try:
+                sweep_results.insert(0, [recipe.output_value_by_name(out, project_folder)
+                                         for out in ('tcp', 'hsp', 'csp')])
+            except Exception:
+                raise Exception(recipe.failure_message(project_folder))
+    sweep_par = [' | '.join('{}: {}'.format(n, v) for n, v in zip(comf_inputs, comb))
+                 for comb in comf_combs]
 
     # load the results
     try:
@@ -189,3 +328,7 @@ if all_required_inputs(ghenv.Component) and _run:
         CSP = recipe_result(recipe.output_value_by_name('csp', project_folder))
     except Exception:
         raise Exception(recipe.failure_message(project_folder))
+    if len(sweep_) != 0:  # output the metrics of each combination in the sweep
+        TCP, HSP, CSP = [list_to_data_tree(list(res)) for res in zip(*sweep_results)]
+    # the model is stored so that its id cannot be re-used by a new Model
+    sc.sticky[cache_key] = (sim_hash, project_folder, _model)
@@ -39,12 +39,12 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '0 :: Basic Properties'
 ghenv.Component.AdditionalHelpFromDocStrings = "5"
 
+import scriptcontext as sc
 
 try:  # import the core honeybee dependencies
     from honeybee.boundarycondition import Outdoors, Ground, Surface, boundary_conditions
     from honeybee.facetype import Wall, RoofCeiling, Floor
     from honeybee.room import Room
-    from honeybee.face import Face
     from honeybee.orientation import angles_from_num_orient, face_orient_index
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
@@ -55,56 +55,87 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
-def check_type(face, boundary_c, face_type):
-    """Check whether a given Face is of a certain type."""
-    return isinstance(face.boundary_condition, boundary_c) and \
-        isinstance(face.type, face_type)
+def face_category(face):
+    """Get the category of a Face that determines which input can make it adiabatic."""
+    bc, f_type = face.boundary_condition, face.type
+    if isinstance(bc, (Outdoors, Ground)):
+        if isinstance(f_type, Wall):
+            return 'exterior_wall'
+        if isinstance(f_type, RoofCeiling):
+            return 'roof'
+        if isinstance(f_type, Floor):
+            return 'exposed_floor'
+    elif isinstance(bc, Surface):
+        if isinstance(f_type, Wall):
+            return 'interior_wall'
+        if isinstance(f_type, (RoofCeiling, Floor)):
+            return 'interior_floor'
+    return None
 
 
-def check_and_assign_adiabatic_to_face(face):
-    """Check if a face if of a relevant type and assign Adiabatic if so."""
-    
-    # assign the adiabatic property to roofs
-    if roofs_ and check_type(face, (Outdoors, Ground), RoofCeiling):
-        face.boundary_condition = boundary_conditions.adiabatic
-    
-    # assign the adiabatic property to exposed floors
-    if exposed_floors_ and check_type(face, (Outdoors, Ground), Floor):
-        face.boundary_condition = boundary_conditions.adiabatic
-    
-    # assign the adiabatic property to exposed floors
-    if interior_walls_ and check_type(face, Surface, Wall):
-        face.boundary_condition = boundary_conditions.adiabatic
-    
-    # assign the adiabatic property to exposed floors
-    if interior_floors_ and check_type(face, Surface, (RoofCeiling, Floor)):
-        face.boundary_condition = boundary_conditions.adiabatic
+def obj_faces(obj):
+    """Get a list of the Faces of a Room or a list with a single Face."""
+    return obj.faces if isinstance(obj, Room) else (obj,)
+
+
+def face_index(hb_objs, num_orient):
+    """Get the category and orientation of each Face, re-using them if unchanged.
+
+    Args:
+        hb_objs: A list of the input honeybee Rooms and Faces.
+        num_orient: An integer for the number of orientations into which
+            exterior walls are binned. Zero means no orientations are needed.
+
+    Returns:
+        A tuple with a list of face categories for each object and a list of
+        orientation indices for each object (None if num_orient is zero).
+    """
+    cache_key = 'adiabatic_by_type_{}'.format(ghenv.Component.InstanceGuid)
+    obj_ids = [id(obj) for obj in hb_objs]
+    cache = sc.sticky.get(cache_key)
+    if cache is None or cache['ids'] != obj_ids:
+        categories = [[face_category(f) for f in obj_faces(obj)] for obj in hb_objs]
+        # the objects are stored in the cache so that their ids cannot be re-used
+        cache = {'ids': obj_ids, 'objs': hb_objs, 'categories': categories,
+                 'orients': {}}
+        sc.sticky[cache_key] = cache
+    if num_orient == 0:
+        return cache['categories'], None
+    try:
+        orients = cache['orients'][num_orient]
+    except KeyError:  # bin the exterior walls into the orientations
+        angles = angles_from_num_orient(num_orient)
+        orients = []
+        for obj, f_cats in zip(hb_objs, cache['categories']):
+            orients.append([
+                face_orient_index(f, angles) if f_cat == 'exterior_wall' else None
+                for f, f_cat in zip(obj_faces(obj), f_cats)])
+        cache['orients'][num_orient] = orients
+    return cache['categories'], orients
 
 
 if all_required_inputs(ghenv.Component):
-    # duplicate the initial objects
-    hb_objs = [obj.duplicate() for obj in _hb_objs]
-    
-    # assign the adiabatic property to the walls
-    if len(exterior_walls_) > 0:
-        angles = angles_from_num_orient(len(exterior_walls_))
-        for obj in hb_objs:
-            if isinstance(obj, Room):
-                for face in obj.faces:
-                    if check_type(face, (Outdoors, Ground), Wall):
-                        orient_i = face_orient_index(face, angles)
-                        if orient_i is not None and exterior_walls_[orient_i]:
-                            face.boundary_condition = boundary_conditions.adiabatic
-            else:  # assume it is a Face
-                if check_type(obj, (Outdoors, Ground), Wall):
-                    orient_i = face_orient_index(obj, angles)
-                    if orient_i is not None and exterior_walls_[orient_i]:
-                        obj.boundary_condition = boundary_conditions.adiabatic
-    
-    # assign the adiabatic property to all of the other face types
-    for obj in hb_objs:
-        if isinstance(obj, Room):
-            for face in obj.faces:
-                check_and_assign_adiabatic_to_face(face)
-        else:  # assume it is a Face
-            check_and_assign_adiabatic_to_face(obj)
+    # get the category of each face and the face categories to be made adiabatic
+    categories, orients = face_index(_hb_objs, len(exterior_walls_))
+    adiabatic_cats = set(cat for cat, flag in (
+        ('roof', roofs_), ('exposed_floor', exposed_floors_),
+        ('interior_wall', interior_walls_), ('interior_floor', interior_floors_))
+        if flag)
+
+    # duplicate only the objects with faces to be made adiabatic
+    hb_objs = []
+    for i, obj in enumerate(_hb_objs):
+        adiabatic_faces = []
+        for j, f_cat in enumerate(categories[i]):
+            if f_cat in adiabatic_cats:
+                adiabatic_faces.append(j)
+            elif f_cat == 'exterior_wall' and orients is not None:
+                orient_i = orients[i][j]
+                if orient_i is not None and exterior_walls_[orient_i]:
+                    adiabatic_faces.append(j)
+        if len(adiabatic_faces) != 0:
+            obj = obj.duplicate()
+            faces = obj_faces(obj)
+            for j in adiabatic_faces:
+                faces[j].boundary_condition = boundary_conditions.adiabatic
+        hb_objs.append(obj)
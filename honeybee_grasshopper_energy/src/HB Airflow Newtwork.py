@@ -106,6 +106,11 @@ dictate when the operable Apertures of the Room open.
             and the _long_axis_ above. This default assumption may not be
             appropriate if the Model represents only a portion of a larger
             building.
+        _cpu_count_: An integer to set the number of CPUs used to generate the
+            leakage of the Model Rooms, which are split into groups that are
+            processed in parallel. If unspecified, it will automatically default
+            to one less than the number of CPUs currently available on the
+            machine (or 1 if only one processor is available).
 
     Returns:
         model: The input Honeybee Model for which the Airflow network has
@@ -120,10 +125,6 @@ ghenv.Component.SubCategory = '3 :: Loads'
 ghenv.Component.AdditionalHelpFromDocStrings = '4'
 
 import math
-try:
-    from ladybug_geometry.geometry3d.pointvector import Vector3D
-except ImportError as e:
-    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
 
 try:
     from honeybee_energy.ventcool.afn import generate
@@ -131,7 +132,8 @@ except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
 
 try:
-    from ladybug_rhino.grasshopper import all_required_inputs, give_warning
+    from ladybug_rhino.grasshopper import all_required_inputs, give_warning, \
+        recommended_processor_count, run_function_in_parallel
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
@@ -140,6 +142,13 @@ leakage_templates = {
     'medium': 'Medium',
     'verypoor': 'VeryPoor'
 }
+# operable apertures with normals closer than 10 degrees to vertical are horizontal
+horiz_cos = math.cos(math.radians(10))
+
+
+def generate_room_group_leakage(i):
+    """Generate the AFN leakage for one of the groups of Model Rooms."""
+    generate(room_groups[i], leakage, use_room_infiltration, pressure, delta_pressure)
 
 
 if all_required_inputs(ghenv.Component):
@@ -158,13 +167,12 @@ if all_required_inputs(ghenv.Component):
     delta_pressure = _delta_pressure_ if _delta_pressure_ is not None else 4
 
     # check for operable exterior apertures that are horizontal as E+ cannot simulate these
-    up_vec, horiz_aps = Vector3D(0, 0, 1), []
-    for ap in model.apertures:
-        if ap.is_operable:
-            ang = math.degrees(ap.normal.angle(up_vec))
-            if ang < 10 or ang > 170:
-                ap.is_operable = False
-                horiz_aps.append(ap.identifier)
+    horiz_aps = [ap for room in model.rooms for face in room.faces
+                 for ap in face.apertures
+                 if ap.is_operable and abs(ap.normal.z) > horiz_cos]
+    for ap in horiz_aps:
+        ap.is_operable = False
+    horiz_aps = [ap.identifier for ap in horiz_aps]
     if len(horiz_aps) != 0:
         msg = 'The following exterior operable apertures are within 10 degrees of ' \
             'being horizontal.\nThese cannot be simulated in EnergyPlus and so they ' \
@@ -173,7 +181,13 @@ if all_required_inputs(ghenv.Component):
         give_warning(ghenv.Component, msg)
 
     # generate the AFN leakage for all of the surfaces of the Model
-    generate(model.rooms, leakage, use_room_infiltration, pressure, delta_pressure)
+    if _cpu_count_ is not None:
+        workers = _cpu_count_
+    else:
+        workers = recommended_processor_count() if len(model.rooms) > 1 else 1
+    workers = max(min(workers, len(model.rooms)), 1)
+    room_groups = [model.rooms[i::workers] for i in range(workers)]
+    run_function_in_parallel(generate_room_group_leakage, workers, workers)
 
     # set up the Model-wide VentilationSimulationParameters for the AFN
     vent_sim_par = model.properties.energy.ventilation_simulation_control
@@ -30,6 +30,14 @@ Schedule" component under HB-Radiance should be used.
             above the floor. Note that such a center point might lie outside
             rooms that are significantly concave and no daylight controls
             will be assigned to these rooms in this case.
+        unordered_: Set to True to have the _sensor_points_ interpreted as an
+            unordered cloud of points rather than a list that aligns with the
+            input _rooms. In this case, each point will be assigned to the Room
+            that contains it, which is useful when sensor points are exported
+            from another tool that does not preserve the order of the rooms.
+            When several points lie within the same Room, the first of these
+            points will be used and any points outside of all rooms will be
+            ignored with a warning. (Default: False).
         _ill_setpoint_: A number for the illuminance setpoint in lux beyond which
             electric lights are dimmed if there is sufficient daylight.
             Some common setpoints are listed below. (Default: 300 lux).
@@ -68,6 +76,8 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '3 :: Loads'
 ghenv.Component.AdditionalHelpFromDocStrings = '2'
 
+import math
+
 try:
     from honeybee.model import Model
     from honeybee.room import Room
@@ -88,6 +98,63 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def room_grid_index(room_bounds):
+    """Build a grid index in the XY plane over the bounding boxes of Rooms.
+
+    Args:
+        room_bounds: A list of (min, max) Point3D tuples for each Room.
+
+    Returns:
+        A tuple with the size of the grid cells and a dictionary that maps each
+        (x, y) grid cell to the indices of the Rooms with bounding boxes over it.
+    """
+    dims = [max(r_max.x - r_min.x, r_max.y - r_min.y) for r_min, r_max in room_bounds]
+    cell = sum(dims) / len(dims) if sum(dims) > 0 else 1
+    grid = {}
+    for i, (r_min, r_max) in enumerate(room_bounds):
+        for x in range(int(math.floor(r_min.x / cell)),
+                       int(math.floor(r_max.x / cell)) + 1):
+            for y in range(int(math.floor(r_min.y / cell)),
+                           int(math.floor(r_max.y / cell)) + 1):
+                try:
+                    grid[(x, y)].append(i)
+                except KeyError:
+                    grid[(x, y)] = [i]
+    return cell, grid
+
+
+def match_points_to_rooms(points, rooms):
+    """Match an unordered list of sensor points to the Rooms that contain them.
+
+    Args:
+        points: A list of Point3D for the sensor positions.
+        rooms: A list of Honeybee Rooms.
+
+    Returns:
+        A tuple with two items.
+
+        -   room_points: A list with one Point3D (or None) for each of the rooms.
+
+        -   outside_pts: A list of the input points that lie outside all rooms.
+    """
+    room_bounds = [(room.min, room.max) for room in rooms]
+    cell, grid = room_grid_index(room_bounds)
+    room_points, outside_pts = [None] * len(rooms), []
+    for pt in points:
+        cell_key = (int(math.floor(pt.x / cell)), int(math.floor(pt.y / cell)))
+        for i in grid.get(cell_key, ()):
+            r_min, r_max = room_bounds[i]
+            if r_min.x <= pt.x <= r_max.x and r_min.y <= pt.y <= r_max.y and \
+                    r_min.z <= pt.z <= r_max.z and \
+                    rooms[i].geometry.is_point_inside(pt):
+                if room_points[i] is None:
+                    room_points[i] = pt
+                break
+        else:
+            outside_pts.append(pt)
+    return room_points, outside_pts
+
+
 if all_required_inputs(ghenv.Component):
     # duplicate the initial objects
     rooms = [room.duplicate() for room in _rooms]
@@ -105,7 +172,7 @@ if all_required_inputs(ghenv.Component):
 
     # set default values and perform checks
     dist_from_floor = 0.8 / conversion_to_meters()
-    if len(_sensor_points_) != 0:
+    if len(_sensor_points_) != 0 and not unordered_:
         assert len(_sensor_points_) == len(hb_objs), 'Number of sensor points ({}) ' \
             'must align exactly with the number of rooms ({}).'.format(
                 len(_sensor_points_), len(hb_objs))
@@ -126,6 +193,23 @@ if all_required_inputs(ghenv.Component):
                 current_tolerance())
             if dl_control is None:
                 unassigned_rooms.append(room.display_name)
+    elif unordered_:
+        sensor_pts = [to_point3d(pt) for pt in _sensor_points_]
+        room_points, outside_pts = match_points_to_rooms(sensor_pts, hb_objs)
+        for i, (room, sensor_pt) in enumerate(zip(hb_objs, room_points)):
+            if sensor_pt is not None:
+                dl_control = DaylightingControl(
+                    sensor_pt, longest_list(_ill_setpoint_, i),
+                    longest_list(_control_fract_, i), longest_list(_min_power_in_, i),
+                    longest_list(_min_light_out_, i), longest_list(off_at_min_, i))
+                room.properties.energy.daylighting_control = dl_control
+            else:
+                unassigned_rooms.append(room.display_name)
+        if len(outside_pts) != 0:
+            msg = '{} sensor points do not lie within any of the room volumes ' \
+                'and have been ignored.'.format(len(outside_pts))
+            print(msg)
+            give_warning(ghenv.Component, msg)
     else:
         for i, room in enumerate(hb_objs):
             sensor_pt = to_point3d(_sensor_points_[i])
@@ -13,6 +13,9 @@ _
 This component will not edit any of the schedule objects associated with each load
 value. If no schedule currently exists to describe how the load varies over the
 simulation, the "Always On" schedule will be used as a default.
+_
+Rooms that start with the same load object and receive the same value will
+share a single new load object rather than each getting their own copy.
 -
 
     Args:
@@ -69,8 +72,11 @@ ghenv.Component.SubCategory = '3 :: Loads'
 ghenv.Component.AdditionalHelpFromDocStrings = "2"
 
 import uuid
+import json
+import hashlib
 
 try:
+    from honeybee.typing import clean_ep_string
     from honeybee.model import Model
     from honeybee.room import Room
 except ImportError as e:
@@ -99,26 +105,45 @@ except ImportError as e:
 always_on = schedule_by_identifier('Always On')
 
 
-def dup_load(hb_obj, object_name, object_class):
-    """Duplicate a load object assigned to a Room or ProgramType."""
-    # try to get the load object assgined to the Room or ProgramType
+def get_load(hb_obj, object_name):
+    """Get a load object assigned to a Room or ProgramType."""
     try:  # assume it's a Room
         load_obj = hb_obj.properties
         for attribute in ('energy', object_name):
             load_obj = getattr(load_obj, attribute)
     except AttributeError:  # it's a ProgramType
         load_obj = getattr(hb_obj, object_name)
+    return load_obj
+
+
+def load_identifier(load_obj):
+    """Get a unique identifier for a load object that is derived from its properties.
+
+    The identifier is the display name of the load (truncated to 50 characters)
+    followed by a hash of the load properties. So it is always short enough for
+    EnergyPlus and loads with different properties get different identifiers.
+    """
+    load_dict = load_obj.to_dict(abridged=True)
+    load_dict.pop('identifier', None)
+    load_dict.pop('display_name', None)
+    hasher = hashlib.md5(json.dumps(load_dict, sort_keys=True).encode('utf-8'))
+    name = clean_ep_string(load_obj.display_name)[:50].strip()
+    return '{}_{}'.format(name, hasher.hexdigest()[:8])
+
 
-    load_id = '{}_{}'.format(hb_obj.identifier, object_name)
+def dup_load(load_obj, object_name, object_class):
+    """Duplicate a load object or create a new one if it does not exist."""
     try:  # duplicate the load object
         dup_load = load_obj.duplicate()
-        dup_load.identifier = load_id
+        dup_load.display_name = load_obj.display_name
         return dup_load
     except AttributeError:  # create a new object
         try:  # assume it's People, Lighting, Equipment or Infiltration
-            return object_class(load_id, 0, always_on)
+            new_load = object_class(object_name, 0, always_on)
         except:  # it's a Ventilation object
-            return object_class(load_id)
+            new_load = object_class(object_name)
+        new_load.display_name = object_name
+        return new_load
 
 
 def assign_load(hb_obj, load_obj, object_name):
@@ -136,6 +161,38 @@ def duplicate_and_id_program(program):
     return new_prog
 
 
+def assign_load_values(hb_objs, values, object_name, object_class, attribute):
+    """Assign a list of load values to Rooms or ProgramTypes.
+
+    All objects that have the same starting load object and that receive the
+    same value are assigned one shared load object, which is created only once.
+    Note that this only avoids duplicating the load in memory since each Room
+    still writes its own copy of the load to the IDF.
+
+    Args:
+        hb_objs: A list of Rooms or ProgramTypes to be edited.
+        values: A list of load values that align with the hb_objs according to
+            the longest list rule.
+        object_name: Text for the attribute of the load object on the Room or
+            ProgramType (eg. people).
+        object_class: The class of the load object (eg. People).
+        attribute: Text for the attribute of the load object to be set with
+            the values (eg. people_per_area).
+    """
+    new_loads = {}
+    for i, obj in enumerate(hb_objs):
+        load_obj = get_load(obj, object_name)
+        value = longest_list(values, i)
+        try:
+            new_load = new_loads[(id(load_obj), value)]
+        except KeyError:
+            new_load = dup_load(load_obj, object_name, object_class)
+            setattr(new_load, attribute, value)
+            new_load.identifier = load_identifier(new_load)
+            new_loads[(id(load_obj), value)] = new_load
+        assign_load(obj, new_load, object_name)
+
+
 if all_required_inputs(ghenv.Component):
     # duplicate the initial objects
     mod_obj, edit_objs = [], []
@@ -166,63 +223,48 @@ if all_required_inputs(ghenv.Component):
 
     # assign the people_per_floor_
     if len(people_per_floor_) != 0:
-        for i, obj in enumerate(edit_objs):
-            people = dup_load(obj, 'people', People)
-            people.people_per_area = longest_list(people_per_floor_, i)
-            assign_load(obj, people, 'people')
+        assign_load_values(
+            edit_objs, people_per_floor_, 'people', People, 'people_per_area')
 
     # assign the lighting_per_floor_
     if len(lighting_per_floor_) != 0:
-        for i, obj in enumerate(edit_objs):
-            lighting = dup_load(obj, 'lighting', Lighting)
-            lighting.watts_per_area = longest_list(lighting_per_floor_, i)
-            assign_load(obj, lighting, 'lighting')
+        assign_load_values(
+            edit_objs, lighting_per_floor_, 'lighting', Lighting, 'watts_per_area')
 
     # assign the electric_per_floor_
     if len(electric_per_floor_) != 0:
-        for i, obj in enumerate(edit_objs):
-            equip = dup_load(obj, 'electric_equipment', ElectricEquipment)
-            equip.watts_per_area = longest_list(electric_per_floor_, i)
-            assign_load(obj, equip, 'electric_equipment')
+        assign_load_values(
+            edit_objs, electric_per_floor_, 'electric_equipment',
+            ElectricEquipment, 'watts_per_area')
 
     # assign the gas_per_floor_
     if len(gas_per_floor_) != 0:
-        for i, obj in enumerate(edit_objs):
-            equip = dup_load(obj, 'gas_equipment', GasEquipment)
-            equip.watts_per_area = longest_list(gas_per_floor_, i)
-            assign_load(obj, equip, 'gas_equipment')
+        assign_load_values(
+            edit_objs, gas_per_floor_, 'gas_equipment', GasEquipment, 'watts_per_area')
 
     # assign the hot_wtr_per_floor_
     if len(hot_wtr_per_floor_) != 0:
-        for i, obj in enumerate(edit_objs):
-            shw = dup_load(obj, 'service_hot_water', ServiceHotWater)
-            shw.flow_per_area = longest_list(hot_wtr_per_floor_, i)
-            assign_load(obj, shw, 'service_hot_water')
+        assign_load_values(
+            edit_objs, hot_wtr_per_floor_, 'service_hot_water',
+            ServiceHotWater, 'flow_per_area')
 
     # assign the infilt_per_exterior_
     if len(infilt_per_exterior_) != 0:
-        for i, obj in enumerate(edit_objs):
-            infilt = dup_load(obj, 'infiltration', Infiltration)
-            infilt.flow_per_exterior_area = longest_list(infilt_per_exterior_, i)
-            assign_load(obj, infilt, 'infiltration')
+        assign_load_values(
+            edit_objs, infilt_per_exterior_, 'infiltration',
+            Infiltration, 'flow_per_exterior_area')
 
     # assign the vent_per_floor_
     if len(vent_per_floor_) != 0:
-        for i, obj in enumerate(edit_objs):
-            vent = dup_load(obj, 'ventilation', Ventilation)
-            vent.flow_per_area = longest_list(vent_per_floor_, i)
-            assign_load(obj, vent, 'ventilation')
+        assign_load_values(
+            edit_objs, vent_per_floor_, 'ventilation', Ventilation, 'flow_per_area')
 
     # assign the vent_per_person_
     if len(vent_per_person_) != 0:
-        for i, obj in enumerate(edit_objs):
-            vent = dup_load(obj, 'ventilation', Ventilation)
-            vent.flow_per_person = longest_list(vent_per_person_, i)
-            assign_load(obj, vent, 'ventilation')
+        assign_load_values(
+            edit_objs, vent_per_person_, 'ventilation', Ventilation, 'flow_per_person')
 
     # assign the vent_ach_
     if len(vent_ach_) != 0:
-        for i, obj in enumerate(edit_objs):
-            vent = dup_load(obj, 'ventilation', Ventilation)
-            vent.air_changes_per_hour = longest_list(vent_ach_, i)
-            assign_load(obj, vent, 'ventilation')
+        assign_load_values(
+            edit_objs, vent_ach_, 'ventilation', Ventilation, 'air_changes_per_hour')
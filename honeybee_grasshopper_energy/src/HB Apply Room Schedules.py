@@ -16,6 +16,9 @@ gas_equip_sch_ to a Room that has no GasEquipment object associated with it.
 This situation can be avoided by first passing the Rooms or ProgramTypes
 through the "HB Apply Load Values" component to establish a value for a
 given load.
+_
+Rooms that start with the same load object and receive the same schedule will
+share a single new load object rather than each getting their own copy.
 -
 
     Args:
@@ -78,8 +81,11 @@ ghenv.Component.SubCategory = '2 :: Schedules'
 ghenv.Component.AdditionalHelpFromDocStrings = "3"
 
 import uuid
+import json
+import hashlib
 
 try:
+    from honeybee.typing import clean_ep_string
     from honeybee.model import Model
     from honeybee.room import Room
 except ImportError as e:
@@ -99,26 +105,59 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
-def schedule_object(schedule):
-    """Get a schedule object by its identifier or return it it it's already a schedule."""
+# dictionary of schedules that have been looked up from the library in this run
+lib_schedules = {}
+
+
+def schedule_object(schedule, schedules):
+    """Get a schedule object by its identifier or return it it it's already a schedule.
+
+    Args:
+        schedule: A schedule object or the identifier of a schedule in the library.
+        schedules: A dictionary of schedules that have already been looked up
+            during this run of the component, which will be used and updated.
+    """
     if isinstance(schedule, str):
-        return schedule_by_identifier(schedule)
+        try:
+            return schedules[schedule]
+        except KeyError:
+            sch_obj = schedule_by_identifier(schedule)
+            schedules[schedule] = sch_obj
+            return sch_obj
     return schedule
 
 
-def dup_load(hb_obj, object_name, input_name):
-    """Duplicate a load object assigned to a Room or ProgramType."""
-    # try to get the load object assgined to the Room or ProgramType
+def get_load(hb_obj, object_name):
+    """Get a load object assigned to a Room or ProgramType."""
     try:  # assume it's a Room
         load_obj = hb_obj.properties
         for attribute in ('energy', object_name):
             load_obj = getattr(load_obj, attribute)
     except AttributeError:  # it's a ProgramType
         load_obj = getattr(hb_obj, object_name)
+    return load_obj
+
+
+def load_identifier(load_obj):
+    """Get a unique identifier for a load object that is derived from its properties.
 
+    The identifier is the display name of the load (truncated to 50 characters)
+    followed by a hash of the load properties. So it is always short enough for
+    EnergyPlus and loads with different properties get different identifiers.
+    """
+    load_dict = load_obj.to_dict(abridged=True)
+    load_dict.pop('identifier', None)
+    load_dict.pop('display_name', None)
+    hasher = hashlib.md5(json.dumps(load_dict, sort_keys=True).encode('utf-8'))
+    name = clean_ep_string(load_obj.display_name)[:50].strip()
+    return '{}_{}'.format(name, hasher.hexdigest()[:8])
+
+
+def dup_load(load_obj, object_name, input_name):
+    """Duplicate a load object assigned to a Room or ProgramType."""
     try:  # duplicate the load object
         dup_load = load_obj.duplicate()
-        dup_load.identifier = '{}_{}'.format(hb_obj.identifier, object_name)
+        dup_load.display_name = load_obj.display_name
         return dup_load
     except AttributeError:
         raise ValueError(
@@ -142,6 +181,39 @@ def duplicate_and_id_program(program):
     return new_prog
 
 
+def assign_load_schedules(hb_objs, schedules, object_name, input_name, attribute):
+    """Assign a list of schedules to the loads of Rooms or ProgramTypes.
+
+    All objects that have the same starting load object and that receive the
+    same schedule are assigned one shared load object, which is created only once.
+    Note that this only avoids duplicating the load in memory since each Room
+    still writes its own copy of the load to the IDF.
+
+    Args:
+        hb_objs: A list of Rooms or ProgramTypes to be edited.
+        schedules: A list of schedules or schedule identifiers that align with
+            the hb_objs according to the longest list rule.
+        object_name: Text for the attribute of the load object on the Room or
+            ProgramType (eg. people).
+        input_name: Text for the name of the component input, which is used
+            to report errors.
+        attribute: Text for the attribute of the load object to be set with
+            the schedules (eg. occupancy_schedule).
+    """
+    new_loads = {}
+    for i, obj in enumerate(hb_objs):
+        load_obj = get_load(obj, object_name)
+        sch = schedule_object(longest_list(schedules, i), lib_schedules)
+        try:
+            new_load = new_loads[(id(load_obj), id(sch))]
+        except KeyError:
+            new_load = dup_load(load_obj, object_name, input_name)
+            setattr(new_load, attribute, sch)
+            new_load.identifier = load_identifier(new_load)
+            new_loads[(id(load_obj), id(sch))] = new_load
+        assign_load(obj, new_load, object_name)
+
+
 if all_required_inputs(ghenv.Component):
     # duplicate the initial objects
     mod_obj, edit_objs = [], []
@@ -172,70 +244,55 @@ if all_required_inputs(ghenv.Component):
 
     # assign the occupancy schedule
     if len(occupancy_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            people = dup_load(obj, 'people', 'occupancy_sch_')
-            people.occupancy_schedule = schedule_object(longest_list(occupancy_sch_, i))
-            assign_load(obj, people, 'people')
+        assign_load_schedules(
+            edit_objs, occupancy_sch_, 'people', 'occupancy_sch_', 'occupancy_schedule')
 
     # assign the activity schedule
     if len(activity_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            people = dup_load(obj, 'people', 'activity_sch_')
-            people.activity_schedule = schedule_object(longest_list(activity_sch_, i))
-            assign_load(obj, people, 'people')
+        assign_load_schedules(
+            edit_objs, activity_sch_, 'people', 'activity_sch_', 'activity_schedule')
 
     # assign the lighting schedule
     if len(lighting_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            lighting = dup_load(obj, 'lighting', 'lighting_sch_')
-            lighting.schedule = schedule_object(longest_list(lighting_sch_, i))
-            assign_load(obj, lighting, 'lighting')
+        assign_load_schedules(
+            edit_objs, lighting_sch_, 'lighting', 'lighting_sch_', 'schedule')
 
     # assign the electric equipment schedule
     if len(electric_equip_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            equip = dup_load(obj, 'electric_equipment', 'electric_equip_sch_')
-            equip.schedule = schedule_object(longest_list(electric_equip_sch_, i))
-            assign_load(obj, equip, 'electric_equipment')
+        assign_load_schedules(
+            edit_objs, electric_equip_sch_, 'electric_equipment',
+            'electric_equip_sch_', 'schedule')
 
     # assign the gas equipment schedule
     if len(gas_equip_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            equip = dup_load(obj, 'gas_equipment', 'gas_equip_sch_')
-            equip.schedule = schedule_object(longest_list(gas_equip_sch_, i))
-            assign_load(obj, equip, 'gas_equipment')
+        assign_load_schedules(
+            edit_objs, gas_equip_sch_, 'gas_equipment', 'gas_equip_sch_', 'schedule')
 
     # assign the hot water schedule
     if len(hot_water_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            shw = dup_load(obj, 'service_hot_water', 'hot_water_sch_')
-            shw.schedule = schedule_object(longest_list(hot_water_sch_, i))
-            assign_load(obj, shw, 'service_hot_water')
+        assign_load_schedules(
+            edit_objs, hot_water_sch_, 'service_hot_water',
+            'hot_water_sch_', 'schedule')
 
     # assign the infiltration schedule
     if len(infiltration_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            infiltration = dup_load(obj, 'infiltration', 'infiltration_sch_')
-            infiltration.schedule = schedule_object(longest_list(infiltration_sch_, i))
-            assign_load(obj, infiltration, 'infiltration')
+        assign_load_schedules(
+            edit_objs, infiltration_sch_, 'infiltration',
+            'infiltration_sch_', 'schedule')
 
     # assign the ventilation schedule
     if len(ventilation_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            ventilation = dup_load(obj, 'ventilation', 'ventilation_sch_')
-            ventilation.schedule = schedule_object(longest_list(ventilation_sch_, i))
-            assign_load(obj, ventilation, 'ventilation')
+        assign_load_schedules(
+            edit_objs, ventilation_sch_, 'ventilation', 'ventilation_sch_', 'schedule')
 
     # assign the heating setpoint schedule
     if len(heating_setpt_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            setpoint = dup_load(obj, 'setpoint', 'heating_setpt_sch_')
-            setpoint.heating_schedule = schedule_object(longest_list(heating_setpt_sch_, i))
-            assign_load(obj, setpoint, 'setpoint')
+        assign_load_schedules(
+            edit_objs, heating_setpt_sch_, 'setpoint',
+            'heating_setpt_sch_', 'heating_schedule')
 
     # assign the cooling setpoint schedule
     if len(cooling_setpt_sch_) != 0:
-        for i, obj in enumerate(edit_objs):
-            setpoint = dup_load(obj, 'setpoint', 'cooling_setpt_sch_')
-            setpoint.cooling_schedule = schedule_object(longest_list(cooling_setpt_sch_, i))
-            assign_load(obj, setpoint, 'setpoint')
+        assign_load_schedules(
+            edit_objs, cooling_setpt_sch_, 'setpoint',
+            'cooling_setpt_sch_', 'cooling_schedule')
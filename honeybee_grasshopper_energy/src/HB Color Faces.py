@@ -38,9 +38,11 @@ Visualize face and sub-face level energy simulation results as colored geometry.
 
     Returns:
         report: ...
-        mesh: A colored mesh of the face/sub-face geometry colored using the input
-            _data. Multiple meshes will be output for several data collections
-            are input.
+        mesh: A single joined mesh of the face/sub-face geometry colored using
+            the input _data. Note that this is one mesh for all of the faces
+            rather than a separate mesh for each face. The triangulated geometry
+            of this mesh is cached such that it is only re-built when the input
+            faces change and other changes (eg. a new sim_step_) only re-color it.
         wire_frame: A list of polylines representing the outline of the faces.
         legend: Geometry representing the legend for the colored favess.
         title: A text object for the global title.
@@ -65,6 +67,13 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '6 :: Result'
 ghenv.Component.AdditionalHelpFromDocStrings = '2'
 
+import scriptcontext as sc
+
+try:
+    from ladybug_geometry.geometry3d.mesh import Mesh3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:
     from honeybee.model import Model
     from honeybee.room import Room
@@ -78,8 +87,7 @@ except ImportError as e:
 
 try:
     from ladybug_rhino.togeometry import to_point3d
-    from ladybug_rhino.fromgeometry import from_face3ds_to_colored_mesh, \
-        from_face3d_to_wireframe
+    from ladybug_rhino.fromgeometry import from_mesh3d, from_face3d_to_wireframe
     from ladybug_rhino.text import text_objects
     from ladybug_rhino.fromobjects import legend_objects
     from ladybug_rhino.color import color_to_color
@@ -89,6 +97,42 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def face_geometry(color_obj):
+    """Get the mesh and wireframes of faces, re-using them if faces are unchanged.
+
+    The (punched) geometry of the color_obj is only evaluated if the faces changed.
+
+    Args:
+        color_obj: The ColorFace object with the honeybee Faces, Apertures and
+            Doors matched to data.
+
+    Returns:
+        A tuple with the joined, triangulated Mesh3D of all faces, a list with
+        the number of mesh faces for each honeybee face and a list of wireframe
+        polylines for all of the faces.
+    """
+    cache_key = 'color_faces_{}'.format(ghenv.Component.InstanceGuid)
+    faces = color_obj.matched_flat_faces
+    geo_ids = [id(face) for face in faces]
+    cache = sc.sticky.get(cache_key)
+    if cache is not None and cache['ids'] == geo_ids:
+        return cache['mesh'], cache['counts'], cache['wire_frame']
+
+    # build the joined mesh and the wireframes from scratch
+    face_meshes = [geo.triangulated_mesh3d for geo in color_obj.matched_flat_geometry]
+    joined_mesh = Mesh3D.join_meshes(face_meshes)
+    counts = [len(f_mesh.faces) for f_mesh in face_meshes]
+    wire_frame = []
+    for face in faces:
+        wire_frame.extend(from_face3d_to_wireframe(face.geometry))
+    # the faces are stored in the cache so that their ids cannot be re-used
+    sc.sticky[cache_key] = {
+        'ids': geo_ids, 'faces': faces, 'mesh': joined_mesh,
+        'counts': counts, 'wire_frame': wire_frame
+    }
+    return joined_mesh, counts, wire_frame
+
+
 if all_required_inputs(ghenv.Component):
     # extract any faces from input Rooms or Models
     faces = []
@@ -112,11 +156,10 @@ if all_required_inputs(ghenv.Component):
     color_obj = ColorFace(_data, faces, legend_par_, sim_step_, normalize_,
                           units_abbreviation())
     graphic = color_obj.graphic_container
-    mesh = [from_face3ds_to_colored_mesh([fc], col) for fc, col in
-            zip(color_obj.matched_flat_geometry, graphic.value_colors)]
-    wire_frame = []
-    for face in color_obj.matched_flat_faces:
-        wire_frame.extend(from_face3d_to_wireframe(face.geometry))
+    face_mesh, counts, wire_frame = face_geometry(color_obj)
+    mesh_colors = [col for col, count in zip(graphic.value_colors, counts)
+                   for _ in range(count)]
+    mesh = from_mesh3d(Mesh3D(face_mesh.vertices, face_mesh.faces, mesh_colors))
     legend = legend_objects(graphic.legend)
     title = text_objects(color_obj.title_text, graphic.lower_title_location,
                          graphic.legend_parameters.text_height,
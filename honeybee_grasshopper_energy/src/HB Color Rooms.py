@@ -39,9 +39,11 @@ Visualize Room-level energy simulation results as colored Room geometry.
 
     Returns:
         report: ...
-        mesh: A colored mesh of the Room floor geometry colored using the input
-            _data. Multiple meshes will be output for several data collections
-            are input.
+        mesh: A single joined mesh of the Room floor geometry colored using
+            the input _data. Note that this is one mesh for all of the rooms
+            rather than a separate mesh for each room. The triangulated geometry
+            of this mesh is cached such that it is only re-built when the input
+            rooms change and other changes (eg. a new sim_step_) only re-color it.
         wire_frame: A list of polylines representing the outline of the
             room volumes.
         legend: Geometry representing the legend for the colored rooms.
@@ -67,6 +69,13 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '6 :: Result'
 ghenv.Component.AdditionalHelpFromDocStrings = '2'
 
+import scriptcontext as sc
+
+try:
+    from ladybug_geometry.geometry3d.mesh import Mesh3D
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
+
 try:
     from honeybee.model import Model
     from honeybee.room import Room
@@ -80,8 +89,7 @@ except ImportError as e:
 
 try:
     from ladybug_rhino.togeometry import to_point3d
-    from ladybug_rhino.fromgeometry import from_face3ds_to_colored_mesh, \
-        from_polyface3d_to_wireframe
+    from ladybug_rhino.fromgeometry import from_mesh3d, from_polyface3d_to_wireframe
     from ladybug_rhino.text import text_objects
     from ladybug_rhino.fromobjects import legend_objects
     from ladybug_rhino.color import color_to_color
@@ -124,6 +132,45 @@ def split_solar_enclosure_data(data_to_split, rooms):
     return split_data
 
 
+def room_geometry(rooms, color_obj):
+    """Get the floor mesh and wireframes of rooms, re-using them if rooms are unchanged.
+
+    The floor geometry of the color_obj is only evaluated if the rooms changed.
+
+    Args:
+        rooms: A list of all honeybee Rooms for which wireframes will be generated.
+        color_obj: The ColorRoom object with the honeybee Rooms matched to data.
+
+    Returns:
+        A tuple with the joined, triangulated Mesh3D of all floor faces, a list
+        with the number of mesh faces for each matched room and a list of
+        wireframe polylines for all of the rooms.
+    """
+    cache_key = 'color_rooms_{}'.format(ghenv.Component.InstanceGuid)
+    matched_rooms = color_obj.matched_rooms
+    geo_ids = ([id(rm) for rm in rooms], [id(rm) for rm in matched_rooms])
+    cache = sc.sticky.get(cache_key)
+    if cache is not None and cache['ids'] == geo_ids:
+        return cache['mesh'], cache['counts'], cache['wire_frame']
+
+    # build the joined mesh and the wireframes from scratch
+    flr_meshes, counts = [], []
+    for flrs in color_obj.matched_floor_faces:
+        room_meshes = [flr.triangulated_mesh3d for flr in flrs]
+        counts.append(sum(len(r_mesh.faces) for r_mesh in room_meshes))
+        flr_meshes.extend(room_meshes)
+    joined_mesh = Mesh3D.join_meshes(flr_meshes)
+    wire_frame = []
+    for room in rooms:
+        wire_frame.extend(from_polyface3d_to_wireframe(room.geometry))
+    # the rooms are stored in the cache so that their ids cannot be re-used
+    sc.sticky[cache_key] = {
+        'ids': geo_ids, 'rooms': (rooms, matched_rooms), 'mesh': joined_mesh,
+        'counts': counts, 'wire_frame': wire_frame
+    }
+    return joined_mesh, counts, wire_frame
+
+
 if all_required_inputs(ghenv.Component):
     # extract any rooms from input Models
     rooms = []
@@ -152,11 +199,10 @@ if all_required_inputs(ghenv.Component):
     color_obj = ColorRoom(_data, rooms, legend_par_, sim_step_, norm_by_flr_,
                           units_abbreviation(), space_based=space_based)
     graphic = color_obj.graphic_container
-    mesh = [from_face3ds_to_colored_mesh(flrs, col) for flrs, col in
-            zip(color_obj.matched_floor_faces, graphic.value_colors)]
-    wire_frame = []
-    for room in rooms:
-        wire_frame.extend(from_polyface3d_to_wireframe(room.geometry))
+    flr_mesh, counts, wire_frame = room_geometry(rooms, color_obj)
+    mesh_colors = [col for col, count in zip(graphic.value_colors, counts)
+                   for _ in range(count)]
+    mesh = from_mesh3d(Mesh3D(flr_mesh.vertices, flr_mesh.faces, mesh_colors))
     legend = legend_objects(graphic.legend)
     title = text_objects(color_obj.title_text, graphic.lower_title_location,
                          graphic.legend_parameters.text_height,
@@ -58,6 +58,23 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def day_data_collection(schedule_day, applied, date, type_limit, timestep, day_cols):
+    """Get a DataCollection for a ScheduleDay with metadata for where it is applied.
+
+    Each ScheduleDay is only evaluated once per run and the data_collection is
+    stored in day_cols under its id and timestep. Any repeated ScheduleDays get
+    a copy of the stored DataCollection with their own metadata.
+    """
+    key = (id(schedule_day), timestep)
+    try:
+        data_col = day_cols[key].duplicate()
+    except KeyError:
+        data_col = schedule_day.data_collection(date, type_limit, timestep)
+        day_cols[key] = data_col
+    data_col.header.metadata['applied'] = applied
+    return data_col
+
+
 if all_required_inputs(ghenv.Component):
     # get the schedue from the library if it's a string
     if isinstance(_schedule, str):
@@ -69,36 +86,24 @@ if all_required_inputs(ghenv.Component):
     type_limit = _schedule.schedule_type_limit
 
     if isinstance(_schedule, ScheduleRuleset):
-        # process the default ScheduleDay
-        default = _schedule.default_day_schedule.data_collection(
-            st_date, type_limit, _timestep_)
-        default.header.metadata['applied'] = 'default'
-
-        # create the ScheduleDay DataCollections
-        day_names = [_schedule.default_day_schedule.display_name]
-        day_data = [default]
+        # collect each ScheduleDay along with where it is applied
+        days = [(_schedule.default_day_schedule, 'default')]
         for rule in _schedule.schedule_rules:
-            data_col = rule.schedule_day.data_collection(
-                st_date, type_limit, _timestep_)
             meta_str = ', '.join(rule.days_applied) + \
                 ' | {} to {}'.format(rule.start_date, rule.end_date)
-            data_col.header.metadata['applied'] = meta_str
-            day_names.append(rule.schedule_day.display_name)
-            day_data.append(data_col)
-
-        # process the design day schedules
+            days.append((rule.schedule_day, meta_str))
         if _schedule.summer_designday_schedule is not None:
-            summer = _schedule.summer_designday_schedule.data_collection(
-                st_date, type_limit, _timestep_)
-            summer.header.metadata['applied'] = 'summer design'
-            day_names.append(_schedule.summer_designday_schedule.display_name)
-            day_data.append(summer)
+            days.append((_schedule.summer_designday_schedule, 'summer design'))
         if _schedule.winter_designday_schedule is not None:
-            winter = _schedule.winter_designday_schedule.data_collection(
-                st_date, type_limit, _timestep_)
-            winter.header.metadata['applied'] = 'winter design'
-            day_names.append(_schedule.winter_designday_schedule.display_name)
-            day_data.append(winter)
+            days.append((_schedule.winter_designday_schedule, 'winter design'))
+
+        # create the ScheduleDay DataCollections
+        day_cols = {}
+        day_names, day_data = [], []
+        for sch_day, applied in days:
+            day_names.append(sch_day.display_name)
+            day_data.append(day_data_collection(
+                sch_day, applied, st_date, type_limit, _timestep_, day_cols))
 
     elif isinstance(_schedule, ScheduleFixedInterval):
         msg = 'Input schedule "{}" is a FixedInterval schedule\nand cannot ' \
@@ -73,39 +73,39 @@ else:
 
 
 if all_required_inputs(ghenv.Component):
-    # extract any rooms from input Models and duplicate the rooms
+    # create the HVAC
+    name = clean_and_id_ep_string('Detailed HVAC') if _name_ is None else \
+        clean_ep_string(_name_)
+    specification = json.loads(_hvac_system.ToJson())
+    hvac = DetailedHVAC(name, specification)
+    if _name_ is not None:
+        hvac.display_name = _name_
+    hvac_rooms = set(hvac.thermal_zones)
+
+    # extract the rooms in the HVAC zones, duplicating the objects to avoid editing input
     rooms, hb_objs = [], []
     for hb_obj in _hb_objs:
         if isinstance(hb_obj, Model):
             new_obj = hb_obj.duplicate()
             hb_objs.append(new_obj)
-            rooms.extend(new_obj.rooms)
+            rooms.extend(room for room in new_obj.rooms if room.zone in hvac_rooms)
         elif isinstance(hb_obj, Room):
-            new_obj = hb_obj.duplicate()
-            hb_objs.append(new_obj)
-            rooms.append(new_obj)
+            if hb_obj.zone in hvac_rooms:
+                hb_obj = hb_obj.duplicate()
+                rooms.append(hb_obj)
+            hb_objs.append(hb_obj)
         else:
             raise ValueError(
                 'Expected Honeybee Room or Model. Got {}.'.format(type(hb_obj)))
 
-    # create the HVAC
-    name = clean_and_id_ep_string('Detailed HVAC') if _name_ is None else \
-        clean_ep_string(_name_)
-    specification = json.loads(_hvac_system.ToJson())
-    hvac = DetailedHVAC(name, specification)
-    if _name_ is not None:
-        hvac.display_name = _name_
-
     # apply the HVAC system to the rooms
-    hvac_rooms = set(hvac.thermal_zones)
     hvac_count, rel_rooms, no_setp_rooms = 0, set(), []
     for room in rooms:
-        if room.zone in hvac_rooms:
-            room.properties.energy.hvac = hvac
-            rel_rooms.add(room.zone)
-            hvac_count += 1
-            if room.properties.energy.setpoint is None:
-                no_setp_rooms.append(room.full_id)
+        room.properties.energy.hvac = hvac
+        rel_rooms.add(room.zone)
+        hvac_count += 1
+        if room.properties.energy.setpoint is None:
+            no_setp_rooms.append(room.full_id)
 
     # give a warning if no rooms were assigned the HVAC or if there are missing rooms
     if hvac_count == 0:
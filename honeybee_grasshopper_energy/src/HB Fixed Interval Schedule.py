@@ -11,6 +11,10 @@
 """
 Create a schedule defined by a list of values at a fixed interval or timestep
 running over the entirety of the simulation period.
+_
+Unnamed schedules with identical values, timestep, start date and type limit
+share a single identifier across all components on the canvas. This way, they
+are written only once to the schedules folder upon translation to IDF.
 -
 
     Args:
@@ -48,6 +52,17 @@ running over the entirety of the simulation period.
                 * Angle
                 * Delta Temperature
                 * Control Level
+        ruleset_tol_: An optional number for the maximum difference between the
+            input values and the values of a ScheduleRuleset that will be inferred
+            from them. When specified, the daily profiles of the input values
+            are grouped into a small set of day schedules where each day
+            deviates from its group's profile by no more than this tolerance.
+            The result is a ScheduleRuleset, which is much lighter in the IDF
+            than a CSV of fixed interval values. Note that the values must
+            span the entirety of a non-leap year to use this option and 1 Jan
+            is assumed to be a Sunday, which is the default for the
+            simulation RunPeriod. The error introduced by the conversion is
+            written to the report. (Default: None).
 
     Returns:
         report: Reports, errors, warnings, etc.
@@ -62,6 +77,10 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '2 :: Schedules'
 ghenv.Component.AdditionalHelpFromDocStrings = '4'
 
+import hashlib
+
+import scriptcontext as sc
+
 try:  # import the ladybug dependencies
     from ladybug.dt import Date
     from ladybug.analysisperiod import AnalysisPeriod
@@ -75,6 +94,9 @@ except ImportError as e:
 
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.schedule.fixedinterval import ScheduleFixedInterval
+    from honeybee_energy.schedule.ruleset import ScheduleRuleset
+    from honeybee_energy.schedule.rule import ScheduleRule
+    from honeybee_energy.schedule.day import ScheduleDay
     from honeybee_energy.lib.scheduletypelimits import schedule_type_limit_by_identifier
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
@@ -85,6 +107,99 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def schedule_content_hash(values, timestep, start_date, type_limit, tolerance):
+    """Get a hash for the content of a fixed interval schedule."""
+    hasher = hashlib.md5()
+    content = (tuple(values), timestep, str(start_date), start_date.leap_year,
+               type_limit.identifier, tolerance)
+    hasher.update(str(content).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def infer_ruleset(identifier, values, timestep, type_limit, tolerance):
+    """Infer a ScheduleRuleset from annual values at a fixed interval.
+
+    Each daily profile is grouped with the first profile that it matches within
+    the tolerance. The most common profile becomes the default day schedule and
+    the days of the other profiles are turned into rules, which cover the weeks
+    of the year where the profile occurs on the same days of the week.
+
+    Args:
+        identifier: Text for the identifier of the ScheduleRuleset.
+        values: A list of 8760 * timestep values starting on 1 Jan.
+        timestep: An integer for the number of steps per hour of the values.
+        type_limit: A ScheduleTypeLimit for the ScheduleRuleset.
+        tolerance: A number for the maximum difference between the input values
+            and the ones of the ScheduleRuleset.
+
+    Returns:
+        A tuple with three items.
+
+        -   schedule: The inferred ScheduleRuleset.
+
+        -   max_error: The maximum difference between the input values and those
+            of the ScheduleRuleset.
+
+        -   rmse: The root mean square error of the ScheduleRuleset values.
+    """
+    # group the daily profiles within the tolerance
+    day_len = 24 * timestep
+    profiles, day_groups = [], []
+    for st_i in range(0, len(values), day_len):
+        day = values[st_i:st_i + day_len]
+        for g_i, prof in enumerate(profiles):
+            if all(abs(v - p) <= tolerance for v, p in zip(day, prof)):
+                break
+        else:  # the day does not match any existing profile
+            g_i = len(profiles)
+            profiles.append(day)
+        day_groups.append(g_i)
+
+    # compute the error introduced by the grouping
+    max_error, sq_error = 0, 0
+    for d_i, g_i in enumerate(day_groups):
+        for v, p in zip(values[d_i * day_len:(d_i + 1) * day_len], profiles[g_i]):
+            max_error = max(max_error, abs(v - p))
+            sq_error += (v - p) ** 2
+    rmse = (sq_error / len(values)) ** 0.5
+
+    # create the day schedules and use the most common one as the default
+    sch_days = []
+    for i, prof in enumerate(profiles):
+        suffix = '_Day {}'.format(i)  # truncate the identifier to fit the suffix
+        day_id = clean_ep_string(identifier[:100 - len(suffix)].strip() + suffix)
+        sch_days.append(ScheduleDay.from_values_at_timestep(day_id, prof, timestep))
+    counts = [day_groups.count(g_i) for g_i in range(len(profiles))]
+    default_i = counts.index(max(counts))
+
+    # get the days of the week of each profile for every week of the year
+    week_count = 53
+    week_dows = [{} for _ in range(week_count)]
+    for doy_i, g_i in enumerate(day_groups):
+        if g_i != default_i:
+            week_dows[doy_i // 7].setdefault(g_i, []).append(doy_i % 7)
+
+    # create rules over consecutive weeks with the same days of the week
+    rules = []
+    for g_i, sch_day in enumerate(sch_days):
+        if g_i == default_i:
+            continue
+        run_start, run_dows = 0, ()
+        for w_i in range(week_count + 1):
+            dows = tuple(week_dows[w_i].get(g_i, ())) if w_i < week_count else ()
+            if dows != run_dows:
+                if len(run_dows) != 0:
+                    apply_days = [dow in run_dows for dow in range(7)]
+                    rules.append(ScheduleRule(
+                        sch_day, *apply_days,
+                        start_date=Date.from_doy(run_start * 7 + 1),
+                        end_date=Date.from_doy(min(w_i * 7, 365))))
+                run_start, run_dows = w_i, dows
+
+    schedule = ScheduleRuleset(identifier, sch_days[default_i], rules, type_limit)
+    return schedule, max_error, rmse
+
+
 if all_required_inputs(ghenv.Component):
     # set the defaults
     _timestep_ = 1 if _timestep_ is None else _timestep_
@@ -109,9 +224,31 @@ if all_required_inputs(ghenv.Component):
     elif isinstance(_type_limit_, str):
         _type_limit_ = schedule_type_limit_by_identifier(_type_limit_)
 
+    # re-use the identifier of any identical unnamed schedule on the canvas
+    if _name_ is None:
+        sch_ids = sc.sticky.setdefault('fixed_interval_schedule_ids', {})
+        content_hash = schedule_content_hash(
+            _values, _timestep_, start_date, _type_limit_, ruleset_tol_)
+        name = sch_ids.setdefault(content_hash, name)
+
     # create the schedule object
-    schedule = ScheduleFixedInterval(
-        name, _values, _type_limit_, _timestep_, start_date,
-        placeholder_value=0, interpolate=False)
+    whole_year = a_per.is_annual and not a_per.is_leap_year and \
+        len(_values) == 8760 * _timestep_
+    if ruleset_tol_ is not None and not whole_year:
+        msg = 'Values must span an entire non-leap year in order to infer a ' \
+            'ScheduleRuleset.\nThe ruleset_tol_ has been ignored.'
+        print(msg)
+        give_warning(ghenv.Component, msg)
+    if ruleset_tol_ is not None and whole_year:
+        schedule, max_error, rmse = infer_ruleset(
+            name, _values, _timestep_, _type_limit_, ruleset_tol_)
+        print('Inferred a ScheduleRuleset with {} day schedules and {} rules.\n'
+              'Maximum error: {}\nRoot mean square error: {}'.format(
+                  len(schedule.day_schedules), len(schedule.schedule_rules),
+                  round(max_error, 6), round(rmse, 6)))
+    else:
+        schedule = ScheduleFixedInterval(
+            name, _values, _type_limit_, _timestep_, start_date,
+            placeholder_value=0, interpolate=False)
     if _name_ is not None:
         schedule.display_name = _name_
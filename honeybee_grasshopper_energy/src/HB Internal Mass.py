@@ -67,6 +67,8 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '0 :: Basic Properties'
 ghenv.Component.AdditionalHelpFromDocStrings = '0'
 
+import math
+
 try:  # import the core honeybee dependencies
     from honeybee.typing import clean_ep_string
 except ImportError as e:
@@ -88,6 +90,31 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def room_grid_index(room_bounds):
+    """Build a grid index in the XY plane over the bounding boxes of Rooms.
+
+    Args:
+        room_bounds: A list of (min, max) Point3D tuples for each Room.
+
+    Returns:
+        A tuple with the size of the grid cells and a dictionary that maps each
+        (x, y) grid cell to the indices of the Rooms with bounding boxes over it.
+    """
+    dims = [max(r_max.x - r_min.x, r_max.y - r_min.y) for r_min, r_max in room_bounds]
+    cell = sum(dims) / len(dims) if sum(dims) > 0 else 1
+    grid = {}
+    for i, (r_min, r_max) in enumerate(room_bounds):
+        for x in range(int(math.floor(r_min.x / cell)),
+                       int(math.floor(r_max.x / cell)) + 1):
+            for y in range(int(math.floor(r_min.y / cell)),
+                           int(math.floor(r_max.y / cell)) + 1):
+                try:
+                    grid[(x, y)].append(i)
+                except KeyError:
+                    grid[(x, y)] = [i]
+    return cell, grid
+
+
 if all_required_inputs(ghenv.Component):
     # duplicate the initial objects and process the construction
     rooms = [room.duplicate() for room in _rooms]
@@ -101,9 +128,17 @@ if all_required_inputs(ghenv.Component):
         geo = [f for geo in _geo_or_area for f in to_face3d(geo)]
         conversion = conversion_to_meters() ** 2
         areas = [0 for room in rooms]
-        for i, room in enumerate(rooms):
-            for face in geo:
-                if room.geometry.is_point_inside(face.center):
+        # use a grid of room bounding boxes to only test rooms near each face
+        room_bounds = [(room.min, room.max) for room in rooms]
+        cell, grid = room_grid_index(room_bounds)
+        for face in geo:
+            pt = face.center
+            cell_key = (int(math.floor(pt.x / cell)), int(math.floor(pt.y / cell)))
+            for i in grid.get(cell_key, ()):
+                r_min, r_max = room_bounds[i]
+                if r_min.x <= pt.x <= r_max.x and r_min.y <= pt.y <= r_max.y and \
+                        r_min.z <= pt.z <= r_max.z and \
+                        rooms[i].geometry.is_point_inside(pt):
                     areas[i] += face.area * conversion
 
     # create the internal mass objects and assign them to the rooms
@@ -15,6 +15,10 @@ _
 If any of the Faces with missing adjacencies have sub-faces, these will be removed
 in order to accommodate the adiabatic condition. Similarly, if the Face is an
 AirBoundary, the type will be set to a Wall.
+_
+Rooms without any missing adjacencies are passed through without being duplicated
+and the adjacencies of each Room are remembered between runs of the component
+such that only the Rooms that have changed since the last run are re-examined.
 -
 
     Args:
@@ -34,22 +38,67 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '0 :: Basic Properties'
 ghenv.Component.AdditionalHelpFromDocStrings = '0'
 
+import scriptcontext as sc
+
 try:  # import the core honeybee dependencies
     from honeybee.model import Model
     from honeybee.room import Room
+    from honeybee.boundarycondition import Surface, boundary_conditions
+    from honeybee.facetype import AirBoundary, face_types
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
 
 
 try:
     from ladybug_rhino.grasshopper import all_required_inputs
-    from ladybug_rhino.config import current_tolerance, units_system
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def room_adjacencies(rooms):
+    """Get the Face identifiers and adjacencies of Rooms, re-using them if unchanged.
+
+    Args:
+        rooms: A list of honeybee Rooms.
+
+    Returns:
+        A list with a tuple for each Room. Each tuple contains a list of
+        (face index, adjacent room identifier) tuples for the Room's Faces
+        with a Surface boundary condition and a list of the indices of the
+        Room's AirBoundary Faces without a Surface boundary condition.
+    """
+    cache_key = 'patch_adj_{}'.format(ghenv.Component.InstanceGuid)
+    cache = sc.sticky.get(cache_key, {})
+    new_cache, adjacencies = {}, []
+    for room in rooms:
+        try:
+            room_adj = cache[id(room)][1]
+        except KeyError:  # room has changed since the last run
+            adj_ids, air_bnds = [], []
+            for i, face in enumerate(room.faces):
+                if isinstance(face.boundary_condition, Surface):
+                    bc_room = face.boundary_condition.boundary_condition_objects[-1]
+                    adj_ids.append((i, bc_room))
+                elif isinstance(face.type, AirBoundary):
+                    air_bnds.append(i)
+            room_adj = (adj_ids, air_bnds)
+        # the rooms are stored in the cache so that their ids cannot be re-used
+        new_cache[id(room)] = (room, room_adj)
+        adjacencies.append(room_adj)
+    sc.sticky[cache_key] = new_cache
+    return adjacencies
+
+
+def patch_face(face):
+    """Set a Face with a missing adjacency to be Adiabatic."""
+    face.remove_sub_faces()
+    if isinstance(face.type, AirBoundary):
+        face.type = face_types.wall
+    face.boundary_condition = boundary_conditions.adiabatic
+
+
 if all_required_inputs(ghenv.Component):
-    # collect all rooms and duplicate them
+    # collect all rooms
     rooms = []
     for hb_obj in _rooms:
         if isinstance(hb_obj, Model):
@@ -58,10 +107,19 @@ if all_required_inputs(ghenv.Component):
             rooms.append(hb_obj)
         else:
             raise ValueError('Expected Room or Model object. Got {}.'.format(type(hb_obj)))
-    rooms = [room.duplicate() for room in rooms]  # duplicate to avoid editing input
 
-    # patch adjacency across all of the Rooms
-    adj_model = Model('patch_adj_model', rooms=rooms, tolerance=current_tolerance(),
-                      units=units_system())
-    adj_model.properties.energy.missing_adjacencies_to_adiabatic()
-    rooms = adj_model.rooms
+    # get the adjacencies of each room and all room identifiers
+    adjacencies = room_adjacencies(rooms)
+    room_ids = set(room.identifier for room in rooms)
+
+    # patch any missing adjacency, duplicating only the rooms that are edited
+    for i, (room, (adj_ids, air_bnds)) in enumerate(zip(rooms, adjacencies)):
+        missing = [f_i for f_i, bc_room in adj_ids if bc_room not in room_ids]
+        if len(missing) != 0 or len(air_bnds) != 0:
+            rooms[i] = room.duplicate()  # duplicate to avoid editing input
+            room_faces = rooms[i].faces
+            for f_i in missing:
+                patch_face(room_faces[f_i])
+            for f_i in air_bnds:  # assume the AirBoundary has a missing Surface
+                room_faces[f_i].type = face_types.wall
+                room_faces[f_i].boundary_condition = boundary_conditions.adiabatic
@@ -19,6 +19,22 @@ pmv, utci category, or adaptive comfort degrees from neutral temperature.
     Args:
         _comf_result: Path to a folder containing CSV files output by a thermal
             mapping component.
+        summary_: Text or an integer to summarize the hourly results of each
+            sensor into a single value instead of loading all of the hourly
+            data into Grasshopper. When used, the result files are streamed
+            one sensor at a time (or in chunks of sensors for NPY results)
+            such that memory use stays bounded even for very large grids.
+            The summarized values are also written to a summary sub-folder
+            of the _comf_result such that they can be re-loaded quickly.
+            The percent options are the percentage of all hours in the study
+            and can be used with condition results to get TCP, HSP and CSP
+            for the case where every hour is occupied. Choose from the following.
+                * 0 - Average
+                * 1 - Maximum
+                * 2 - Minimum
+                * 3 - Percent Neutral
+                * 4 - Percent Hot
+                * 5 - Percent Cold
         _load: Set to True to load the data from the CSV files into Grasshopper.
 
     Returns:
@@ -33,6 +49,11 @@ pmv, utci category, or adaptive comfort degrees from neutral temperature.
             The length of each sub-list matches the number of points in the
             grid. Each value in the sub-list is an hourly data collection
             containing hour-by-hour results for each point.
+        values: Lists of numbers for the summary_ of each sensor. Each branch
+            of the Data Tree represents one of the sensor grids used for
+            analysis. This can be plugged into the "LB Spatial Heatmap" component
+            along with meshes of the sensor grids to visualize the results.
+            This will be None if no summary_ is connected.
 """
 
 ghenv.Component.Name = 'HB Read Thermal Matrix'
@@ -61,10 +82,106 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
 
 try:
-    from ladybug_rhino.grasshopper import all_required_inputs, objectify_output
+    from ladybug_rhino.grasshopper import all_required_inputs, objectify_output, \
+        list_to_data_tree
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+SUMMARY_MAP = {
+    '0': 'average',
+    'average': 'average',
+    '1': 'maximum',
+    'maximum': 'maximum',
+    '2': 'minimum',
+    'minimum': 'minimum',
+    '3': 'neutral',
+    'percent neutral': 'neutral',
+    '4': 'hot',
+    'percent hot': 'hot',
+    '5': 'cold',
+    'percent cold': 'cold'
+}
+CHUNK_SIZE = 1000  # number of sensors loaded into memory at once from NPY files
+NPY_SUMMARY = """
+import sys
+import numpy as np
+mtx = np.load(sys.argv[1], mmap_mode='r')
+summary, chunk_size = sys.argv[3], int(sys.argv[4])
+with open(sys.argv[2], 'w') as out_file:
+    for st in range(0, mtx.shape[0], chunk_size):
+        chunk = np.asarray(mtx[st:st + chunk_size], dtype=float)
+        if summary == 'average':
+            vals = chunk.mean(axis=1)
+        elif summary == 'maximum':
+            vals = chunk.max(axis=1)
+        elif summary == 'minimum':
+            vals = chunk.min(axis=1)
+        elif summary == 'neutral':
+            vals = (chunk == 0).mean(axis=1) * 100
+        elif summary == 'hot':
+            vals = (chunk > 0).mean(axis=1) * 100
+        else:
+            vals = (chunk < 0).mean(axis=1) * 100
+        out_file.write(''.join('{}\\n'.format(v) for v in vals))
+"""
+
+
+def summarize_row(row, summary):
+    """Summarize the hourly values of a single sensor into one number."""
+    if summary == 'average':
+        return sum(row) / len(row)
+    elif summary == 'maximum':
+        return max(row)
+    elif summary == 'minimum':
+        return min(row)
+    elif summary == 'neutral':
+        count = sum(1 for v in row if v == 0)
+    elif summary == 'hot':
+        count = sum(1 for v in row if v > 0)
+    else:
+        count = sum(1 for v in row if v < 0)
+    return count * 100.0 / len(row)
+
+
+def summarize_grid(grid_file, summary, summary_file):
+    """Write summarized values of each sensor in a grid result file to a file.
+
+    CSV files are streamed one sensor at a time while NPY files are processed
+    in chunks of sensors by the Python installation of Ladybug Tools. Any
+    error from the processing of NPY files is raised with its message.
+
+    Args:
+        grid_file: Path to a CSV or NPY file with the results of a sensor grid.
+        summary: Text for the type of summary, which is one of the values
+            of the SUMMARY_MAP.
+        summary_file: Path to a file into which the summarized values will be
+            written with one value per line.
+    """
+    if grid_file.endswith('.csv'):
+        with open(grid_file) as in_file, open(summary_file, 'w') as out_file:
+            for line in in_file:
+                if line.strip():
+                    row = [float(v) for v in line.split(',')]
+                    out_file.write('{}\n'.format(summarize_row(row, summary)))
+    else:
+        # write the script to a file since multi-line commands do not survive cmd.exe
+        script = os.path.join(os.path.dirname(summary_file), 'npy_summary.py')
+        with open(script, 'w') as script_file:
+            script_file.write(NPY_SUMMARY)
+        cmds = [folders.python_exe_path, script, grid_file,
+                summary_file, summary, str(CHUNK_SIZE)]
+        custom_env = os.environ.copy()
+        custom_env['PYTHONHOME'] = ''
+        process = subprocess.Popen(
+            cmds, env=custom_env, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()  # wait for the process to finish
+        if process.returncode != 0 or not os.path.isfile(summary_file):
+            if os.path.isfile(summary_file):  # remove any partially-written file
+                os.remove(summary_file)
+            if not isinstance(stderr, str):
+                stderr = stderr.decode('utf-8', 'replace')
+            raise ValueError(
+                'Failed to summarize results file:\n{}\n{}'.format(grid_file, stderr))
 
 if all_required_inputs(ghenv.Component) and _load:
     # parse the result_info.json into a data collection header
@@ -86,7 +203,31 @@ if all_required_inputs(ghenv.Component) and _load:
         extension = 'npy'
 
     comf_matrix = []
-    if extension == 'csv':
+    if summary_ is not None:
+        # stream the results of each grid into a file of summarized values
+        try:
+            summary = SUMMARY_MAP[str(summary_).lower()]
+        except KeyError:
+            raise ValueError(
+                'Input summary_ "{}" is not recognized. Choose from: {}'.format(
+                    summary_, '\n'.join(SUMMARY_MAP.keys()))
+            )
+        summary_folder = os.path.join(_comf_result, 'summary', summary)
+        if not os.path.isdir(summary_folder):
+            os.makedirs(summary_folder)
+        values = []
+        for grid in grid_list:
+            grid_name = grid['full_id'] if 'full_id' in grid else 'id'
+            grid_file = os.path.join(
+                _comf_result, '{}.{}'.format(grid_name, extension))
+            summary_file = os.path.join(summary_folder, '{}.csv'.format(grid_name))
+            if not os.path.isfile(summary_file) or \
+                    os.path.getmtime(summary_file) < os.path.getmtime(grid_file):
+                summarize_grid(grid_file, summary, summary_file)
+            with open(summary_file) as sum_f:
+                values.append([float(v) for v in sum_f if v.strip()])
+        values = list_to_data_tree(values)
+    elif extension == 'csv':
         # loop through the grid CSV files, parse their results, and build data collections
         for grid in grid_list:
             grid_name = grid['full_id'] if 'full_id' in grid else 'id'
@@ -128,5 +269,6 @@ if all_required_inputs(ghenv.Component) and _load:
             comf_matrix.append(grid_data)
 
     # wrap the maptrix into an object so that it does not slow the Grasshopper UI
-    comf_mtx = objectify_output(
-        '{} Matrix'.format(data_header.data_type.name), comf_matrix)
+    if summary_ is None:
+        comf_mtx = objectify_output(
+            '{} Matrix'.format(data_header.data_type.name), comf_matrix)
@@ -53,6 +53,7 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '2 :: Schedules'
 ghenv.Component.AdditionalHelpFromDocStrings = "2"
 
+import scriptcontext as sc
 
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.schedule.ruleset import ScheduleRuleset
@@ -62,6 +63,10 @@ except ImportError as e:
 
 try:  # import the ladybug dependencies
     from ladybug.dt import Date, DateTime
+    from ladybug.analysisperiod import AnalysisPeriod
+    from ladybug.header import Header
+    from ladybug.datacollection import HourlyContinuousCollection
+    from ladybug.datatype.generic import GenericType
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
 
@@ -70,6 +75,113 @@ try:  # import ladybug_rhino dependencies
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+DAYS_OF_WEEK = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+                'Saturday')
+
+
+def ruleset_day_index(schedule, jan1_dow, hol_doys):
+    """Get the ScheduleDay that applies on each day of the year for a ScheduleRuleset.
+
+    The index is computed once for each ScheduleRuleset, week start day and set
+    of holidays and it is then re-used across runs of the component.
+
+    Args:
+        schedule: A ScheduleRuleset.
+        jan1_dow: An integer from 1 (Sunday) to 7 (Saturday) for the day of the
+            week of 1 Jan.
+        hol_doys: A tuple of integers for the days of the year that are holidays.
+
+    Returns:
+        A list of 365 integers for each day of the year. Each integer is the index
+        of the ScheduleRule that applies on the day. The number of rules denotes
+        the default_day_schedule and the number of rules + 1 denotes the
+        holiday_schedule.
+    """
+    day_indices = sc.sticky.setdefault(
+        'sch_to_data_{}'.format(ghenv.Component.InstanceGuid), {})
+    key = (id(schedule), jan1_dow, hol_doys)
+    try:
+        return day_indices[key][1]
+    except KeyError:  # build the index from scratch
+        rules = schedule.schedule_rules
+        default_i = len(rules)
+        hol_i = default_i + 1 if schedule.holiday_schedule is not None else default_i
+        hol_doys = set(hol_doys)
+        index = []
+        for doy in range(1, 366):
+            if doy in hol_doys:
+                index.append(hol_i)
+                continue
+            dow = (jan1_dow + doy - 2) % 7 + 1
+            for i, rule in enumerate(rules):
+                if rule.does_rule_apply(doy, dow):
+                    index.append(i)
+                    break
+            else:  # no rule applies; use default_day_schedule
+                index.append(default_i)
+        if len(day_indices) > 1000:  # avoid holding on to too many old schedules
+            day_indices.clear()
+        # the schedule is stored in the cache so that its id cannot be re-used
+        day_indices[key] = (schedule, index)
+        return index
+
+
+def day_values_at_timestep(schedule_day, timestep):
+    """Get the values of a ScheduleDay at a timestep.
+
+    The values are computed once for each ScheduleDay and timestep and they are
+    then re-used across the runs of the component, including the runs for the
+    other schedules of a list connected to the _schedule input.
+    """
+    day_values = sc.sticky.setdefault(
+        'sch_to_data_days_{}'.format(ghenv.Component.InstanceGuid), {})
+    key = (id(schedule_day), timestep)
+    try:
+        return day_values[key][1]
+    except KeyError:  # first time that the ScheduleDay is used
+        vals = schedule_day.values_at_timestep(timestep)
+        if len(day_values) > 1000:  # avoid holding on to too many old schedules
+            day_values.clear()
+        # the ScheduleDay is stored in the cache so that its id cannot be re-used
+        day_values[key] = (schedule_day, vals)
+        return vals
+
+
+def ruleset_data(schedule, timestep, start_date, end_date, week_start_day, holidays):
+    """Get a DataCollection of a ScheduleRuleset using its day index.
+
+    This yields the same result as ScheduleRuleset.data_collection for a non-leap
+    year but the values of each day are copied from the ScheduleDay in the index.
+    """
+    # get the index of the ScheduleDay for each day of the year
+    start_dow = DAYS_OF_WEEK.index(week_start_day) + 1
+    jan1_dow = (start_dow - start_date.doy) % 7 + 1
+    hol_doys = tuple(sorted(set(hol.doy for hol in holidays))) \
+        if holidays is not None else ()
+    index = ruleset_day_index(schedule, jan1_dow, hol_doys)
+
+    # get the values over the day for each of the ScheduleDay objects
+    sch_days = [rule.schedule_day for rule in schedule.schedule_rules]
+    sch_days.append(schedule.default_day_schedule)
+    if schedule.holiday_schedule is not None:
+        sch_days.append(schedule.holiday_schedule)
+    day_vals = [day_values_at_timestep(sch_day, timestep) for sch_day in sch_days]
+
+    # fill the values of the data collection from the day values
+    values = []
+    for day_i in index[start_date.doy - 1:end_date.doy]:
+        values.extend(day_vals[day_i])
+    a_period = AnalysisPeriod(start_date.month, start_date.day, 0,
+                              end_date.month, end_date.day, 23, timestep)
+    if schedule.schedule_type_limit is not None:
+        data_type = schedule.schedule_type_limit.data_type
+        unit = schedule.schedule_type_limit.unit
+    else:
+        unit = 'unknown'
+        data_type = GenericType('Unknown Data Type', unit)
+    header = Header(data_type, unit, a_period, metadata={'schedule': schedule.identifier})
+    return HourlyContinuousCollection(header, values)
+
 
 if all_required_inputs(ghenv.Component):
     # get the schedue from the library if it's a string
@@ -97,8 +209,8 @@ if all_required_inputs(ghenv.Component):
 
     # create the DataCollection
     if isinstance(_schedule, ScheduleRuleset):
-        data = _schedule.data_collection(
-            timestep, start_date, end_date, week_start_day, holidays, leap_year=False)
+        data = ruleset_data(
+            _schedule, timestep, start_date, end_date, week_start_day, holidays)
     else:  # assume that it is a ScheduleFixedInterval
         data = _schedule.data_collection_at_timestep(timestep, start_date, end_date)
 
@@ -33,16 +33,16 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '0 :: Basic Properties'
 ghenv.Component.AdditionalHelpFromDocStrings = '3'
 
-try:  # import the honeybee-core dependencies
-    from honeybee.search import filter_array_by_keywords
-except ImportError as e:
-    raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
-
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.lib.constructionsets import CONSTRUCTION_SETS
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
 
+try:
+    from honeybee_grasshopper_energy.search import search_library
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_energy:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.grasshopper import turn_off_old_tag
 except ImportError as e:
@@ -51,8 +51,7 @@ turn_off_old_tag(ghenv.Component)
 
 
 if len(keywords_) == 0:
-    constr_sets = sorted(CONSTRUCTION_SETS)
+    constr_sets = search_library(CONSTRUCTION_SETS, [])
 else:
     split_words = True if join_words_ is None else not join_words_
-    constr_sets = sorted(filter_array_by_keywords(
-        CONSTRUCTION_SETS, keywords_, split_words))
+    constr_sets = search_library(CONSTRUCTION_SETS, keywords_, split_words)
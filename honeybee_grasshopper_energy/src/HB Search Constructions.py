@@ -20,6 +20,22 @@ Search for available Constructions within the honeybee energy standards library.
             keywords for searching. This results in a greater likelihood of
             finding an item in the search but it is not desriable when searching
             for a specific sequence of words. (Default: False).
+        ranges_: Optional text for ranges of numerical properties that the
+            output constructions must satisfy. Each range should be written like
+            "r_value > 2" or "0.2 < u_factor < 0.5" and all ranges must be
+            satisfied by the output constructions. Values are in SI units (m, W/m-K,
+            kg/m3, J/kg-K, m2-K/W, W/m2-K) and constructions that do not have the
+            property are excluded. The properties of the library objects are
+            computed once and then re-used by all searches. Choose from the
+            following properties:
+                * thickness
+                * r_value
+                * u_value
+                * r_factor
+                * u_factor
+                * shgc
+                * solar_transmittance
+                * visible_transmittance
     
     Returns:
         opaque_constrs: A list of opaque constructions within the honeybee energy
@@ -37,34 +53,53 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = "1 :: Constructions"
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
-try:  # import the honeybee-core dependencies
-    from honeybee.search import filter_array_by_keywords
-except ImportError as e:
-    raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
-
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.lib.constructions import OPAQUE_CONSTRUCTIONS
     from honeybee_energy.lib.constructions import WINDOW_CONSTRUCTIONS
     from honeybee_energy.lib.constructions import SHADE_CONSTRUCTIONS
+    from honeybee_energy.lib.constructions import opaque_construction_by_identifier, \
+        window_construction_by_identifier, shade_construction_by_identifier
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
 
+try:
+    from honeybee_grasshopper_energy.search import search_library, \
+        parse_range, filter_by_ranges
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_energy:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.grasshopper import turn_off_old_tag
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 turn_off_old_tag(ghenv.Component)
 
+# numerical properties that can be used in the ranges_
+PROPERTIES = (
+    'thickness', 'r_value', 'u_value', 'r_factor', 'u_factor', 'shgc',
+    'solar_transmittance', 'visible_transmittance'
+)
+
 
 if len(keywords_) == 0:
-    opaque_constrs = sorted(OPAQUE_CONSTRUCTIONS)
-    window_constrs = sorted(WINDOW_CONSTRUCTIONS)
-    shade_constrs = sorted(SHADE_CONSTRUCTIONS)
+    opaque_constrs = search_library(OPAQUE_CONSTRUCTIONS, [])
+    window_constrs = search_library(WINDOW_CONSTRUCTIONS, [])
+    shade_constrs = search_library(SHADE_CONSTRUCTIONS, [])
 else:
     split_words = True if join_words_ is None else not join_words_
-    opaque_constrs = sorted(filter_array_by_keywords(
-        OPAQUE_CONSTRUCTIONS, keywords_, split_words))
-    window_constrs = sorted(filter_array_by_keywords(
-        WINDOW_CONSTRUCTIONS, keywords_, split_words))
-    shade_constrs = sorted(filter_array_by_keywords(
-        SHADE_CONSTRUCTIONS, keywords_, split_words))
+    opaque_constrs = search_library(OPAQUE_CONSTRUCTIONS, keywords_, split_words)
+    window_constrs = search_library(WINDOW_CONSTRUCTIONS, keywords_, split_words)
+    shade_constrs = search_library(SHADE_CONSTRUCTIONS, keywords_, split_words)
+
+# filter the objects by any property ranges
+if len(ranges_) != 0 and ranges_[0] is not None:
+    ranges = [parse_range(r, PROPERTIES) for r in ranges_]
+    opaque_constrs = filter_by_ranges(
+        opaque_constrs, OPAQUE_CONSTRUCTIONS, opaque_construction_by_identifier,
+        ranges, PROPERTIES)
+    window_constrs = filter_by_ranges(
+        window_constrs, WINDOW_CONSTRUCTIONS, window_construction_by_identifier,
+        ranges, PROPERTIES)
+    shade_constrs = filter_by_ranges(
+        shade_constrs, SHADE_CONSTRUCTIONS, shade_construction_by_identifier,
+        ranges, PROPERTIES)
@@ -20,6 +20,25 @@ Search for available Materials within the honeybee energy standards library.
             keywords for searching. This results in a greater likelihood of
             finding an item in the search but it is not desriable when searching
             for a specific sequence of words. (Default: False).
+        ranges_: Optional text for ranges of numerical properties that the
+            output materials must satisfy. Each range should be written like
+            "r_value > 2" or "0.2 < u_factor < 0.5" and all ranges must be
+            satisfied by the output materials. Values are in SI units (m, W/m-K,
+            kg/m3, J/kg-K, m2-K/W, W/m2-K) and materials that do not have the
+            property are excluded. The properties of the library objects are
+            computed once and then re-used by all searches. Choose from the
+            following properties:
+                * thickness
+                * conductivity
+                * density
+                * specific_heat
+                * r_value
+                * u_value
+                * u_factor
+                * shgc
+                * vt
+                * solar_transmittance
+                * visible_transmittance
 
     Returns:
         opaque_mats: A list of opaque materials within the honeybee energy
@@ -35,28 +54,47 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = "1 :: Constructions"
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
-try:  # import the honeybee-core dependencies
-    from honeybee.search import filter_array_by_keywords
-except ImportError as e:
-    raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
-
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.lib.materials import OPAQUE_MATERIALS
     from honeybee_energy.lib.materials import WINDOW_MATERIALS
+    from honeybee_energy.lib.materials import opaque_material_by_identifier, \
+        window_material_by_identifier
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
 
+try:
+    from honeybee_grasshopper_energy.search import search_library, \
+        parse_range, filter_by_ranges
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_energy:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.grasshopper import turn_off_old_tag
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 turn_off_old_tag(ghenv.Component)
 
+# numerical properties that can be used in the ranges_
+PROPERTIES = (
+    'thickness', 'conductivity', 'density', 'specific_heat', 'r_value', 'u_value',
+    'u_factor', 'shgc', 'vt', 'solar_transmittance', 'visible_transmittance'
+)
+
 
 if len(keywords_) == 0:
-    opaque_mats = sorted(OPAQUE_MATERIALS)
-    window_mats = sorted(WINDOW_MATERIALS)
+    opaque_mats = search_library(OPAQUE_MATERIALS, [])
+    window_mats = search_library(WINDOW_MATERIALS, [])
 else:
     split_words = True if join_words_ is None else not join_words_
-    opaque_mats = sorted(filter_array_by_keywords(OPAQUE_MATERIALS, keywords_, split_words))
-    window_mats = sorted(filter_array_by_keywords(WINDOW_MATERIALS, keywords_, split_words))
+    opaque_mats = search_library(OPAQUE_MATERIALS, keywords_, split_words)
+    window_mats = search_library(WINDOW_MATERIALS, keywords_, split_words)
+
+# filter the objects by any property ranges
+if len(ranges_) != 0 and ranges_[0] is not None:
+    ranges = [parse_range(r, PROPERTIES) for r in ranges_]
+    opaque_mats = filter_by_ranges(
+        opaque_mats, OPAQUE_MATERIALS, opaque_material_by_identifier, ranges,
+        PROPERTIES)
+    window_mats = filter_by_ranges(
+        window_mats, WINDOW_MATERIALS, window_material_by_identifier, ranges,
+        PROPERTIES)
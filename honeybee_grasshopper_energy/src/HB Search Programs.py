@@ -53,6 +53,11 @@ try:
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
 
+try:
+    from honeybee_grasshopper_energy.search import search_library
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_energy:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.grasshopper import turn_off_old_tag
 except ImportError as e:
@@ -82,8 +87,5 @@ if bldg_prog_ is not None:
     room_prog = ['{}::{}::{}'.format(_vintage_, bldg_prog_, rp) for rp in room_programs]
 else:
     # return all programs in the library filtered by keyword
-    room_prog = sorted(PROGRAM_TYPES)
-    if _vintage_ is not None:
-        room_prog = filter_array_by_keywords(room_prog, [_vintage_], False)
-    if keywords_ != []:
-        room_prog = filter_array_by_keywords(room_prog, keywords_, False)
+    vintage = [_vintage_] if _vintage_ is not None else []
+    room_prog = search_library(PROGRAM_TYPES, vintage + keywords_, False)
@@ -35,17 +35,17 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = "2 :: Schedules"
 ghenv.Component.AdditionalHelpFromDocStrings = "1"
 
-try:  # import the honeybee-core dependencies
-    from honeybee.search import filter_array_by_keywords
-except ImportError as e:
-    raise ImportError('\nFailed to import honeybee:\n\t{}'.format(e))
-
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.lib.schedules import SCHEDULES
     from honeybee_energy.lib.scheduletypelimits import SCHEDULE_TYPE_LIMITS
 except ImportError as e:
     raise ImportError('\nFailed to import honeybee_energy:\n\t{}'.format(e))
 
+try:
+    from honeybee_grasshopper_energy.search import search_library
+except ImportError as e:
+    raise ImportError('\nFailed to import honeybee_grasshopper_energy:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.grasshopper import turn_off_old_tag
 except ImportError as e:
@@ -54,8 +54,8 @@ turn_off_old_tag(ghenv.Component)
 
 
 if len(keywords_) == 0:
-    schedules = sorted(SCHEDULES)
+    schedules = search_library(SCHEDULES, [])
 else:
     split_words = True if join_words_ is None else not join_words_
-    schedules = sorted(filter_array_by_keywords(SCHEDULES, keywords_, split_words))
+    schedules = search_library(SCHEDULES, keywords_, split_words)
 type_limits = sorted(SCHEDULE_TYPE_LIMITS)
@@ -11,6 +11,11 @@
 """
 Create a schedule using from other ScheduleRulesets and AnalysisPeriods over which
 each schedule should be applied.
+_
+The rules of the resulting schedule are compacted such that rules that are fully
+overwritten by higher-priority rules are removed, ScheduleDays with the same
+values are only written once and neighboring rules that apply the same ScheduleDay
+over adjacent time periods are merged into a single rule.
 -
 
     Args:
@@ -82,6 +87,7 @@ except ImportError as e:
 
 try:  # import the honeybee-energy dependencies
     from honeybee_energy.schedule.day import ScheduleDay
+    from honeybee_energy.schedule.rule import ScheduleRule
     from honeybee_energy.schedule.ruleset import ScheduleRuleset
     from honeybee_energy.lib.schedules import schedule_by_identifier
 except ImportError as e:
@@ -93,6 +99,73 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def day_key(sch_day):
+    """Get a tuple for the values of a ScheduleDay, which can be used to compare it."""
+    return (tuple(sch_day.values), tuple(str(t) for t in sch_day.times),
+            sch_day.interpolate)
+
+
+def non_leap_doy(date):
+    """Get the day of the year of a Date in a non-leap year, like ScheduleRule does.
+
+    Leap year dates after 29 Feb are shifted back by one day and 29 Feb itself
+    becomes the same day of the year as 1 Mar.
+    """
+    if not date.leap_year:
+        return date.doy
+    return date.doy if date <= Date(2, 29, True) else date.doy - 1
+
+
+def rule_doys(rule):
+    """Get the start and end days of the year of a ScheduleRule."""
+    return non_leap_doy(rule.start_date), non_leap_doy(rule.end_date)
+
+
+def compact_rules(schedule):
+    """Compact the ScheduleRules of a ScheduleRuleset without changing its values.
+
+    This removes rules that are shadowed by higher-priority rules, makes all rules
+    with the same ScheduleDay values share one ScheduleDay and merges rules that
+    come one after the other with the same ScheduleDay and either the same days
+    of the week over adjacent dates or the same dates over different days.
+    """
+    # remove shadowed rules and deduplicate the ScheduleDays by value
+    sch_days = {day_key(schedule.default_day_schedule): schedule.default_day_schedule}
+    covered = [set() for _ in range(7)]  # days of the year covered for each weekday
+    rules = []
+    for rule in schedule.schedule_rules:
+        st_doy, end_doy = rule_doys(rule)
+        doys = set(range(st_doy, end_doy + 1)) if st_doy <= end_doy else \
+            set(range(st_doy, 366)) | set(range(1, end_doy + 1))
+        dows = [i for i, apply in enumerate(rule.week_apply_tuple) if apply]
+        if all(doys <= covered[i] for i in dows):
+            continue  # the rule never takes effect
+        for i in dows:
+            covered[i].update(doys)
+        sch_day = sch_days.setdefault(day_key(rule.schedule_day), rule.schedule_day)
+        rules.append([sch_day, set(dows), st_doy, end_doy])
+
+    # merge consecutive rules with the same ScheduleDay
+    merged = []
+    for rule in rules:
+        if len(merged) != 0:
+            prev = merged[-1]
+            same_day = prev[0] is rule[0]
+            reversed_rule = prev[2] > prev[3] or rule[2] > rule[3]
+            if same_day and not reversed_rule and prev[1] == rule[1] and \
+                    prev[2] <= rule[3] + 1 and rule[2] <= prev[3] + 1:
+                prev[2], prev[3] = min(prev[2], rule[2]), max(prev[3], rule[3])
+                continue
+            if same_day and prev[2] == rule[2] and prev[3] == rule[3]:
+                prev[1].update(rule[1])
+                continue
+        merged.append(rule)
+    schedule.schedule_rules = [
+        ScheduleRule(sch_day, *[i in dows for i in range(7)],
+                     start_date=Date.from_doy(st_doy), end_date=Date.from_doy(end_doy))
+        for sch_day, dows, st_doy, end_doy in merged]
+
+
 if all_required_inputs(ghenv.Component):
     # check that the input _season_scheds align with the _analysis_periods
     assert len(_season_scheds) == len(_analysis_periods), \
@@ -121,6 +194,7 @@ if all_required_inputs(ghenv.Component):
                 a_period.st_time.date, a_period.end_time.date)
         for rule in reversed(season_rules):  # preserve priority order of rules
             schedule.add_rule(rule)
+    compact_rules(schedule)
 
     # apply the summer and winter design days if specified
     if len(_summer_des_) != 0:
@@ -86,8 +86,14 @@ considered occupied.
         run_settings_: Settings from the "HB Recipe Settings" component that specify
             how the recipe should be run. This can also be a text string of
             recipe settings.
-        _run: Set to True to run the recipe and get results. This input can also be
-            the integer "2" to run the recipe silently.
+        _run: Set to True to run the recipe and get results. This input can also
+            be the integer "2" to run the recipe silently. If the model, weather
+            files, north, run period and solar body/radiance parameters are
+            unchanged since the last run of this component, the existing
+            Radiance and EnergyPlus results will be reused and only the comfort
+            post-processing will be re-run. So changing the wind speed, schedule
+            or comfort parameters does not require the whole recipe to be
+            re-run.
 
     Returns:
         report: Reports, errors, warnings, etc.
@@ -164,19 +170,73 @@ ghenv.Component.SubCategory = '7 :: Thermal Map'
 ghenv.Component.AdditionalHelpFromDocStrings = '1'
 
 import os
+import hashlib
+import copy
+
+import scriptcontext as sc
 
 try:
     from lbt_recipes.recipe import Recipe
+    from lbt_recipes.settings import RecipeSettings
     from honeybee.model import Model
 except ImportError as e:
     raise ImportError('\nFailed to import lbt_recipes:\n\t{}'.format(e))
 
+try:
+    from ladybug.futil import nukedir
+except ImportError as e:
+    raise ImportError('\nFailed to import ladybug:\n\t{}'.format(e))
+
 try:
     from ladybug_rhino.config import units_system
     from ladybug_rhino.grasshopper import all_required_inputs, recipe_result
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
+# sub-folders of the simulation folder with results of the comfort post-processing
+COMFORT_FOLDERS = ('initial_results', 'results', 'metrics')
+# file that marks the comfort post-processing of the simulation folder as done
+COMFORT_DONE = 'run_comfort_map.done'
+
+
+def stage_hash(model, *args):
+    """Get a hash for the inputs that determine the EnergyPlus and Radiance results.
+
+    Args:
+        model: The Honeybee Model (or HBJSON file path) input to the recipe.
+            Models are hashed with their identifier and their Python id
+            since any change to an upstream Model produces a new object.
+        args: Any other recipe inputs that influence the results before the
+            comfort post-processing. File paths will be hashed with the time
+            at which the file was last modified.
+    """
+    hasher = hashlib.md5()
+    if isinstance(model, Model):
+        model = '{}|{}'.format(model.identifier, id(model))
+    for arg in (model,) + args:
+        if isinstance(arg, str) and os.path.isfile(arg):
+            arg = '{}|{}'.format(arg, os.path.getmtime(arg))
+        hasher.update(str(arg).encode('utf-8'))
+    return hasher.hexdigest()
+
+
+def clear_comfort_results(project_folder, recipe):
+    """Delete the comfort post-processing results of a recipe in a project folder.
+
+    This ensures that only the comfort post-processing is re-run when the recipe
+    is executed again with reload_old set to True. The few steps of the folder
+    preparation that write into the deleted folders are also re-run but all of
+    the EnergyPlus and Radiance simulations are reused.
+    """
+    sim_folder = os.path.join(project_folder, recipe.simulation_id)
+    for sub_f in COMFORT_FOLDERS:
+        sub_dir = os.path.join(sim_folder, sub_f)
+        if os.path.isdir(sub_dir):
+            nukedir(sub_dir, True)
+    done_file = os.path.join(sim_folder, COMFORT_DONE)
+    if os.path.isfile(done_file):
+        os.remove(done_file)
+
 
 if all_required_inputs(ghenv.Component) and _run:
     # create the recipe and set the input arguments
@@ -211,10 +271,27 @@ if all_required_inputs(ghenv.Component) and _run:
                     'Is this correct?\n{}'.format(_model.units, e)
                 raise ValueError(error)
 
+    # check whether the results of a previous run can be reused
+    if isinstance(run_settings_, RecipeSettings):
+        settings = copy.copy(run_settings_)
+    else:
+        settings = RecipeSettings() if run_settings_ is None \
+            else RecipeSettings.from_string(run_settings_)
+    sim_hash = stage_hash(
+        _model, _epw, ddy_, north_, run_period_,
+        solar_body_par_, radiance_par_, settings.folder)
+    cache_key = 'comfort_map_{}'.format(ghenv.Component.InstanceGuid)
+    last_run = sc.sticky.get(cache_key)
+    if last_run is not None and last_run[0] == sim_hash and \
+            os.path.isdir(last_run[1]):
+        clear_comfort_results(last_run[1], recipe)
+        settings.reload_old = True
+        print('Reusing Radiance and EnergyPlus results from:\n{}'.format(last_run[1]))
+
     # run the recipe
     silent = True if _run > 1 else False
     project_folder = recipe.run(
-        run_settings_, radiance_check=True, openstudio_check=True, silent=silent)
+        settings, radiance_check=True, openstudio_check=True, silent=silent)
 
     # load the results
     try:
@@ -227,3 +304,5 @@ if all_required_inputs(ghenv.Component) and _run:
         CSP = recipe_result(recipe.output_value_by_name('csp', project_folder))
     except Exception:
         raise Exception(recipe.failure_message(project_folder))
+    # the model is stored so that its id cannot be re-used by a new Model
+    sc.sticky[cache_key] = (sim_hash, project_folder, _model)
@@ -24,10 +24,20 @@ comfort matrix.
             across the comfort results to be displayed.
         legend_par_: An optional LegendParameter object to change the display
             of the results.
+        max_faces_: An optional integer for the target number of faces in the
+            output mesh. When the input meshes have more faces than this number,
+            the faces will be aggregated onto a coarser grid for display and
+            each cell of the grid will be colored with the area-weighted average
+            of the results that fall within it. This can greatly improve the
+            responsiveness of the Rhino viewport for very dense sensor grids.
+            Note that the output colors and values will always be for the
+            full-resolution results such that they can still be exported.
+            If None, the input meshes will be colored at full resolution.
 
     Returns:
         report: ...
-        mesh: The input mesh objects colored with results.
+        mesh: The input mesh objects colored with results. If max_faces_ is
+            connected, this will be a coarser version of the input meshes.
         legend: Geometry representing the legend for the results.
         title: A text object for the title.
         colors: The colors associated with each input value.
@@ -42,14 +52,19 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '7 :: Thermal Map'
 ghenv.Component.AdditionalHelpFromDocStrings = '2'
 
+import math
+
 try:
+    from ladybug_geometry.geometry2d.pointvector import Point2D
+    from ladybug_geometry.geometry3d.pointvector import Vector3D
+    from ladybug_geometry.geometry3d.plane import Plane
     from ladybug_geometry.geometry3d.mesh import Mesh3D
 except ImportError as e:
     raise ImportError('\nFailed to import ladybug_geometry:\n\t{}'.format(e))
 
 try:
     from ladybug.graphic import GraphicContainer
-    from ladybug.legend import LegendParameters
+    from ladybug.legend import Legend, LegendParameters
     from ladybug.color import Colorset
     from ladybug.datatype.fraction import RelativeHumidity
     from ladybug.datatype.temperature import Temperature
@@ -80,6 +95,195 @@ def colors_from_data_type(data_type):
         return Colorset.thermal_comfort()
 
 
+def clip_to_cell(pts, u_min, v_min, u_max, v_max):
+    """Clip a convex polygon of (u, v) tuples to the rectangle of a grid cell."""
+    for axis, bound, keep_above in ((0, u_min, True), (0, u_max, False),
+                                    (1, v_min, True), (1, v_max, False)):
+        if len(pts) == 0:
+            break
+        clipped, prev = [], pts[-1]
+        prev_in = prev[axis] >= bound if keep_above else prev[axis] <= bound
+        for pt in pts:
+            pt_in = pt[axis] >= bound if keep_above else pt[axis] <= bound
+            if pt_in != prev_in:  # the edge crosses the bound
+                t = (bound - prev[axis]) / (pt[axis] - prev[axis])
+                clipped.append((prev[0] + t * (pt[0] - prev[0]),
+                                prev[1] + t * (pt[1] - prev[1])))
+            if pt_in:
+                clipped.append(pt)
+            prev, prev_in = pt, pt_in
+        pts = clipped
+    return pts
+
+
+def polygon_area(pts):
+    """Get the area of a polygon of (u, v) tuples."""
+    return abs(sum(pts[i - 1][0] * pt[1] - pt[0] * pts[i - 1][1]
+                   for i, pt in enumerate(pts))) / 2.0
+
+
+def merge_rectangles(polys, tol):
+    """Merge the axis-aligned rectangles of a list of polygons into larger ones.
+
+    Rectangles that share a row are first joined into strips and then strips
+    with the same extents in adjacent rows are joined. Polygons that are not
+    axis-aligned rectangles are returned as they are.
+    """
+    rows, others = {}, []
+    for pts in polys:
+        us, vs = [pt[0] for pt in pts], [pt[1] for pt in pts]
+        u_min, v_min, u_max, v_max = min(us), min(vs), max(us), max(vs)
+        if len(pts) != 4 or abs(polygon_area(pts) - (u_max - u_min) *
+                                (v_max - v_min)) > tol * (u_max - u_min + v_max - v_min):
+            others.append(pts)
+            continue
+        key = (int(round(v_min / tol)), int(round(v_max / tol)))
+        rows.setdefault(key, []).append([u_min, u_max, v_min, v_max])
+    columns = {}
+    for row in rows.values():
+        row.sort()
+        strip = row[0]
+        for rect in row[1:] + [None]:
+            if rect is not None and rect[0] <= strip[1] + tol:
+                strip[1] = max(strip[1], rect[1])
+                continue
+            key = (int(round(strip[0] / tol)), int(round(strip[1] / tol)))
+            columns.setdefault(key, []).append(strip)
+            strip = rect
+    rects = []
+    for column in columns.values():
+        column.sort(key=lambda r: r[2])
+        rect = column[0]
+        for strip in column[1:] + [None]:
+            if strip is not None and strip[2] <= rect[3] + tol:
+                rect[3] = max(rect[3], strip[3])
+                continue
+            u0, u1, v0, v1 = rect
+            rects.append(((u0, v0), (u1, v0), (u1, v1), (u0, v1)))
+            rect = strip
+    return rects + others
+
+
+def lod_mesh(mesh, values, target):
+    """Aggregate the faces of a single mesh and their values onto a coarser grid.
+
+    The mesh is split into square cells within its own plane and every face is
+    clipped to the cells that it overlaps. Cells that are fully covered by the
+    mesh become a single quad while cells along the outline of the mesh keep
+    only the part of the cell that the faces cover.
+
+    Args:
+        mesh: A ladybug Mesh3D.
+        values: A list of numbers for each face of the mesh.
+        target: An integer for the target number of cells in the coarse grid.
+
+    Returns:
+        A tuple with the vertices of the coarse grid, its faces and a list of
+        area-weighted average values for each of the faces.
+    """
+    # set up a plane aligned with the first edge and a grid cell size
+    cell = math.sqrt(mesh.area / target)
+    normal = sum(mesh.face_normals, Vector3D(0, 0, 0))
+    normal = normal.normalize() if normal.magnitude > 1e-9 else Vector3D(0, 0, 1)
+    f_0 = mesh.faces[0]
+    x_axis = mesh.vertices[f_0[1]] - mesh.vertices[f_0[0]]
+    x_axis = x_axis - normal * normal.dot(x_axis)
+    x_axis = x_axis if x_axis.magnitude > 1e-9 else None
+    plane = Plane(normal, mesh.min, x_axis)
+    pts_2d = [plane.xyz_to_xy(pt) for pt in mesh.vertices]
+    pts_2d = [(pt.x, pt.y) for pt in pts_2d]
+    tol = cell * 1e-6
+
+    # clip each of the faces to the cells of the grid that it overlaps
+    cells = {}
+    for face, cent, val in zip(mesh.faces, mesh.face_centroids, values):
+        f_pts = [pts_2d[i] for i in face]
+        us, vs = [pt[0] for pt in f_pts], [pt[1] for pt in f_pts]
+        offset = normal.dot(cent - plane.o)
+        for i in range(int(math.floor(min(us) / cell)),
+                       int(math.floor((max(us) - tol) / cell)) + 1):
+            for j in range(int(math.floor(min(vs) / cell)),
+                           int(math.floor((max(vs) - tol) / cell)) + 1):
+                c_pts = clip_to_cell(f_pts, i * cell, j * cell,
+                                     (i + 1) * cell, (j + 1) * cell)
+                area = polygon_area(c_pts) if len(c_pts) >= 3 else 0
+                if area <= tol * cell:
+                    continue
+                try:
+                    c_dat = cells[(i, j)]
+                    c_dat[0] += area
+                    c_dat[1] += val * area
+                    c_dat[2] += offset * area
+                    c_dat[3].append(c_pts)
+                except KeyError:
+                    cells[(i, j)] = [area, val * area, offset * area, [c_pts]]
+
+    # build a quad for each full cell and the covered part of outline cells
+    verts, faces, cell_values = [], [], []
+    cell_area = cell * cell
+    for (i, j), (area, w_val, w_offset, polys) in cells.items():
+        if area >= cell_area * (1 - 1e-6):
+            polys = [((i * cell, j * cell), ((i + 1) * cell, j * cell),
+                      ((i + 1) * cell, (j + 1) * cell), (i * cell, (j + 1) * cell))]
+        else:
+            polys = merge_rectangles(polys, tol)
+        move_vec = normal * (w_offset / area)
+        for pts in polys:
+            st_v = len(verts)
+            for u, v in pts:
+                verts.append(plane.xy_to_xyz(Point2D(u, v)) + move_vec)
+            if len(pts) <= 4:
+                faces.append(tuple(range(st_v, st_v + len(pts))))
+            else:  # clipped faces are convex and can be split into a fan
+                faces.extend((st_v, st_v + k, st_v + k + 1)
+                             for k in range(1, len(pts) - 1))
+            cell_values.extend([w_val / area] * (len(faces) - len(cell_values)))
+    return verts, faces, cell_values
+
+
+def lod_mesh_and_values(lb_meshes, values, max_faces):
+    """Aggregate the faces of meshes and their values onto a coarser grid.
+
+    Meshes are not aggregated if they do not have more faces than their share
+    of max_faces or if aggregating them does not reduce their number of faces.
+
+    Args:
+        lb_meshes: A list of ladybug Mesh3D with faces or vertices that align
+            with the input values.
+        values: A list of numbers for each face or vertex of the lb_meshes.
+        max_faces: An integer for the target number of faces in the output mesh.
+
+    Returns:
+        A tuple with a Mesh3D for the coarse grid and a list of values for each
+        of the faces of the Mesh3D.
+    """
+    total_faces = sum(len(m.faces) for m in lb_meshes)
+    per_vertex = len(values) != total_faces
+    lod_verts, lod_faces, lod_values, st_i = [], [], [], 0
+    for mesh in lb_meshes:
+        # get the values that align with each of the faces of the mesh
+        if per_vertex:
+            m_vals = values[st_i:st_i + len(mesh.vertices)]
+            st_i += len(mesh.vertices)
+            m_vals = [sum(m_vals[i] for i in f) / float(len(f)) for f in mesh.faces]
+        else:
+            m_vals = values[st_i:st_i + len(mesh.faces)]
+            st_i += len(mesh.faces)
+
+        # aggregate the mesh if it has more faces than its share of max_faces
+        target = max(int(max_faces * len(mesh.faces) / float(total_faces)), 1)
+        m_verts, m_faces = mesh.vertices, mesh.faces
+        if target < len(mesh.faces):
+            verts, faces, cell_values = lod_mesh(mesh, m_vals, target)
+            if len(faces) < len(mesh.faces):
+                m_verts, m_faces, m_vals = verts, faces, cell_values
+        st_v = len(lod_verts)
+        lod_verts.extend(m_verts)
+        lod_faces.extend(tuple(i + st_v for i in f) for f in m_faces)
+        lod_values.extend(m_vals)
+    return Mesh3D(lod_verts, lod_faces), lod_values
+
+
 if all_required_inputs(ghenv.Component):
     # load the data and perform and time-slicing operations on it
     data_mtx = de_objectify_output(_comf_mtx)
@@ -120,6 +324,13 @@ if all_required_inputs(ghenv.Component):
 
     # draw rhino objects
     lb_mesh.colors = graphic.value_colors
-    mesh = from_mesh3d(lb_mesh)
+    if max_faces_ is not None and len(lb_mesh.faces) > max_faces_:
+        lod_mesh, lod_values = lod_mesh_and_values(lb_meshes, values, max_faces_)
+        lod_par = graphic.legend_parameters.duplicate()
+        lod_par.min, lod_par.max = graphic.legend.min, graphic.legend.max
+        lod_mesh.colors = Legend(lod_values, lod_par).value_colors
+        mesh = from_mesh3d(lod_mesh)
+    else:
+        mesh = from_mesh3d(lb_mesh)
     legend = legend_objects(graphic.legend)
     colors = [color_to_color(col) for col in lb_mesh.colors]
@@ -81,6 +81,8 @@ ghenv.Component.Category = 'HB-Energy'
 ghenv.Component.SubCategory = '3 :: Loads'
 ghenv.Component.AdditionalHelpFromDocStrings = '4'
 
+import math
+
 try:
     from honeybee_energy.ventcool.opening import VentilationOpening
 except ImportError as e:
@@ -94,15 +96,42 @@ except ImportError as e:
     raise ImportError('\nFailed to import ladybug_rhino:\n\t{}'.format(e))
 
 
+def operable_orientations(rooms):
+    """Get the horizontal orientations of the operable Apertures of Rooms.
+
+    The orientations of all apertures are computed together from their normals,
+    which is equivalent to calling horizontal_orientation() on each aperture.
+
+    Args:
+        rooms: A list of honeybee Rooms.
+
+    Returns:
+        A list with a list of orientations in degrees for each of the Rooms.
+        The list is empty for Rooms without operable apertures.
+    """
+    room_normals = [
+        [ap.normal for face in room.faces for ap in face.apertures if ap.is_operable]
+        for room in rooms]
+    return [[math.degrees(math.atan2(n.x, n.y)) % 360 for n in normals]
+            for normals in room_normals]
+
+
 if all_required_inputs(ghenv.Component):
+    # get the orientations of all operable apertures before editing any rooms
+    room_orients = operable_orientations(_rooms)
+
     # loop through the rooms and assign the objects
     op_count = 0
     rooms = []
     for i, room_init in enumerate(_rooms):
         room = room_init.duplicate()  # duplicate to avoid editing the input
+        rooms.append(room)
 
         # assign the ventilation control for the windows
         room.properties.energy.window_vent_control = longest_list(_vent_cntrl, i)
+        orient_angles = room_orients[i]
+        if len(orient_angles) == 0:  # no operable apertures to be edited
+            continue
 
         # create the base ventilation opening
         f_area = 0.5 if len(_fract_area_oper_) == 0 else longest_list(_fract_area_oper_, i)
@@ -114,29 +143,16 @@ if all_required_inputs(ghenv.Component):
         cross_vent = longest_list(_wind_cross_vent_, i) if \
             len(_wind_cross_vent_) != 0 else None
         if cross_vent is None:
-            # analyze  normals of room's apertures to test if cross vent is possible
-            orient_angles = []
-            for face in room.faces:
-                for ap in face.apertures:
-                    if ap.is_operable:
-                        try:
-                            orient_angles.append(ap.horizontal_orientation())
-                        except ZeroDivisionError:
-                            orient_angles.append(0)
-            if len(orient_angles) != 0:
-                orient_angles.sort()
-                vent_open.wind_cross_vent = \
-                    True if orient_angles[-1] - orient_angles[0] >= 90 else False
-            else:
-                vent_open.wind_cross_vent = False
+            # use the orientations of room's apertures to test if cross vent is possible
+            vent_open.wind_cross_vent = \
+                True if max(orient_angles) - min(orient_angles) >= 90 else False
         else:
             vent_open.wind_cross_vent = cross_vent
         vent_aps = room.properties.energy.assign_ventilation_opening(vent_open)
-        rooms.append(room)
         op_count += len(vent_aps)
 
     # give a warning if no operable windows were found among the connected rooms
     if op_count == 0:
         give_warning(
             ghenv.Component, 'No operable Apertures were found among the connected _rooms.\n'
-            'Make sure that you have set the is_operable property of Apertures to True.')
\ No newline at end of file
+            'Make sure that you have set the is_operable property of Apertures to True.')